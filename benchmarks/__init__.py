@@ -0,0 +1,8 @@
+# coding=utf-8
+"""
+Benchmarks for elib_config
+
+These are not part of the test suite; run them as modules, for example::
+
+    python -m benchmarks.bench_value_call
+"""
@@ -0,0 +1,82 @@
+# coding=utf-8
+"""
+Command line entry point of the benchmark suite
+
+Examples::
+
+    python -m benchmarks run --output baseline.json
+    python -m benchmarks run --output current.json --compare baseline.json --threshold 0.2
+    python -m benchmarks compare baseline.json current.json
+    python -m benchmarks run --filter "^(call|read_config_file)\\."
+"""
+import argparse
+import json
+import platform
+import sys
+import typing
+
+from ._compare import find_regressions, format_comparison
+from ._suite import DEFAULT_FILE_SIZES, DEFAULT_REGISTRY_SIZES, Results, run
+
+
+def _load(file_path: str) -> Results:
+    with open(file_path, encoding='utf8') as stream:
+        return json.load(stream)['results']
+
+
+def _save(file_path: str, results: Results):
+    with open(file_path, 'w', encoding='utf8') as stream:
+        json.dump({'python': platform.python_version(), 'results': results}, stream, indent=2, sort_keys=True)
+
+
+def _compare(baseline: Results, current: Results, threshold: float) -> int:
+    print('\n'.join(format_comparison(baseline, current)))
+    regressions = find_regressions(baseline, current, threshold)
+    for name in regressions:
+        print(f'REGRESSION: {name} is more than {threshold:.0%} slower than the baseline')
+    return 1 if regressions else 0
+
+
+def _sizes(value: str) -> typing.List[int]:
+    return [int(size) for size in value.split(',') if size]
+
+
+def main(argv: typing.Optional[typing.List[str]] = None) -> int:
+    """
+    Runs the benchmark suite, and/or compares results
+
+    :param argv: command line arguments
+    :return: exit code (1 if a regression has been found)
+    """
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.split('\n')[1])
+    commands = parser.add_subparsers(dest='command')
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('--output', default='bench_output.json', help='file to write results to')
+    run_parser.add_argument('--registry-sizes', type=_sizes, default=list(DEFAULT_REGISTRY_SIZES),
+                            help='comma separated numbers of config values')
+    run_parser.add_argument('--file-sizes', type=_sizes, default=list(DEFAULT_FILE_SIZES),
+                            help='comma separated sizes of config files, in bytes')
+    run_parser.add_argument('--filter', help='only run benchmarks whose name matches this regular expression')
+    run_parser.add_argument('--compare', metavar='BASELINE', help='baseline results to compare to')
+    compare_parser = commands.add_parser('compare', help='compare two results files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    for sub_parser in (run_parser, compare_parser):
+        sub_parser.add_argument('--threshold', type=float, default=0.2,
+                                help='tolerated slowdown before failing, as a fraction (default: 0.2)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run(args.registry_sizes, args.file_sizes, name_filter=args.filter)
+        _save(args.output, results)
+        if args.compare:
+            return _compare(_load(args.compare), results, args.threshold)
+        return 0
+    if args.command == 'compare':
+        return _compare(_load(args.baseline), _load(args.current), args.threshold)
+    parser.print_help()
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
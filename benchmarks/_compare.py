@@ -0,0 +1,40 @@
+# coding=utf-8
+"""
+Compares benchmark results against a baseline
+"""
+import typing
+
+from ._suite import Results
+
+
+def find_regressions(baseline: Results, current: Results, threshold: float) -> typing.List[str]:
+    """
+    :param baseline: reference results
+    :param current: new results
+    :param threshold: tolerated slowdown, as a fraction (0.2 means 20% slower than the baseline)
+    :return: names of benchmarks that are slower than the baseline by more than the threshold (benchmarks that only
+        exist on one side are ignored)
+    """
+    regressions = []
+    for name, result in current.items():
+        if name not in baseline:
+            continue
+        if result['seconds'] > baseline[name]['seconds'] * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def format_comparison(baseline: Results, current: Results) -> typing.List[str]:
+    """
+    :param baseline: reference results
+    :param current: new results
+    :return: lines of a human readable comparison table
+    """
+    lines = [f'{"benchmark":<45}{"baseline (µs)":>16}{"current (µs)":>16}{"ratio":>8}']
+    for name, result in current.items():
+        if name not in baseline:
+            lines.append(f'{name:<45}{"-":>16}{result["seconds"] * 1e6:>16.2f}{"-":>8}')
+            continue
+        before, after = baseline[name]['seconds'], result['seconds']
+        lines.append(f'{name:<45}{before * 1e6:>16.2f}{after * 1e6:>16.2f}{after / before:>8.2f}')
+    return lines
@@ -0,0 +1,172 @@
+# coding=utf-8
+"""
+Benchmark cases
+"""
+import os
+import re
+import tempfile
+import time
+import timeit
+import typing
+
+import elib_config
+# noinspection PyProtectedMember
+from elib_config._file._config_file import read_config_file
+# noinspection PyProtectedMember
+from elib_config._value._config_value import ConfigValue
+from .bench_table_schema import wide_table_schema
+from ._synthetic import DEEP, FLAT, VALUE_TYPES, create_config_file_content, create_registry, value_path
+
+DEFAULT_REGISTRY_SIZES = (10, 1000, 50000)
+DEFAULT_FILE_SIZES = (1024, 100 * 1024, 1024 * 1024, 10 * 1024 * 1024)
+_MIN_RUN_TIME = 0.2
+_REPEAT = 3
+
+Results = typing.Dict[str, typing.Dict[str, float]]
+
+
+def _time(func: typing.Callable[[], typing.Any]) -> typing.Dict[str, float]:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    number = max(1, int(_MIN_RUN_TIME / max(elapsed, 1e-9)))
+    best = min(timeit.Timer(func).repeat(repeat=_REPEAT, number=number))
+    return {'seconds': best / number, 'iterations': number}
+
+
+def _write(config_file_path: str, content: str):
+    with open(config_file_path, 'w', encoding='utf8') as stream:
+        stream.write(content)
+    elib_config.invalidate()
+
+
+class _Suite:
+
+    def __init__(self, temp_dir: str, log: typing.Callable[[str], None], name_filter: typing.Optional[str]) -> None:
+        self.temp_dir = temp_dir
+        self.name_filter = re.compile(name_filter) if name_filter else None
+        self.config_file_path = os.path.join(temp_dir, 'config.toml')
+        self.results: Results = {}
+        self.log = log
+        elib_config.ELIBConfig.setup(
+            app_version='0.1',
+            app_name='bench',
+            config_file_path=self.config_file_path,
+            config_sep_str='__',
+        )
+
+    def _selected(self, name: str) -> bool:
+        return self.name_filter is None or bool(self.name_filter.search(name))
+
+    def _record(self, name: str, func: typing.Callable[[], typing.Any]):
+        if not self._selected(name):
+            return
+        self.results[name] = result = _time(func)
+        self.log(f'{name:<45}{result["seconds"] * 1e6:>16.2f} µs')
+
+    def bench_calls(self):
+        """
+        ConfigValue.__call__, for each concrete type
+        """
+        ConfigValue.config_values.clear()
+        lines = ['[bench]']
+        values = {}
+        for index, (type_name, (factory, literal)) in enumerate(VALUE_TYPES.items()):
+            path = value_path(index, FLAT)
+            values[type_name] = factory(*path)
+            lines.append(f'{path[-1]} = {literal}')
+        _write(self.config_file_path, '\n'.join(lines))
+        for type_name, value in values.items():
+            self._record(f'call.{type_name}', value)
+
+    def bench_table_schema(self):
+        """
+        Validation of a single table with many keys
+        """
+        for count in (5, 20, 50):
+            keys, raw_table = wide_table_schema(count)
+            ConfigValue.config_values.clear()
+            value = elib_config.ConfigValueTableArray('bench', description='', keys=keys)
+            # noinspection PyProtectedMember
+            self._record(f'validate_table.{count}_keys',
+                         lambda: value._validate_table(raw_table, 'bench'))  # pylint: disable=protected-access
+
+    def bench_lists(self, count: int = 50000):
+        """
+        Validation of long lists of numbers, as plain lists and as compact lists
+        """
+        raw_values = {int: list(range(count)), float: [float(index) for index in range(count)]}
+        for element_type, raw_value in raw_values.items():
+            for compact in (False, True):
+                ConfigValue.config_values.clear()
+                value = elib_config.ConfigValueList('bench', element_type=element_type, description='', compact=compact)
+                value.set_limits(0, count)
+
+                def _cast(value=value, raw_value=raw_value):
+                    value.clear_cache()
+                    # noinspection PyProtectedMember
+                    value._cast(raw_value)  # pylint: disable=protected-access
+
+                kind = 'compact' if compact else 'plain'
+                self._record(f'validate_list.{element_type.__name__}.{kind}.{count}', _cast)
+
+    def bench_registry(self, count: int, shape: str):
+        """
+        validate_config and write_example_config, against a synthetic registry
+        """
+        if not any(self._selected(f'{bench}.{shape}.{count}') for bench in ('validate_config', 'write_example_config')):
+            return
+        _, content = create_registry(count, shape)
+        _write(self.config_file_path, content)
+        example_file_path = os.path.join(self.temp_dir, 'example.toml')
+        self._record(f'validate_config.{shape}.{count}', elib_config.validate_config)
+
+        def _write_example():
+            # an up-to-date example is not rewritten: remove it to measure the generation of the example
+            if os.path.exists(example_file_path):
+                os.remove(example_file_path)
+            elib_config.write_example_config(example_file_path)
+
+        self._record(f'write_example_config.{shape}.{count}', _write_example)
+
+    def bench_read(self, size: int):
+        """
+        read_config_file, for a synthetic config file that has to be parsed every time
+        """
+        if not self._selected(f'read_config_file.{size}'):
+            return
+        _write(self.config_file_path, create_config_file_content(size))
+
+        def _read():
+            elib_config.invalidate()
+            read_config_file()
+
+        self._record(f'read_config_file.{size}', _read)
+
+
+def run(registry_sizes: typing.Iterable[int] = DEFAULT_REGISTRY_SIZES,
+        file_sizes: typing.Iterable[int] = DEFAULT_FILE_SIZES,
+        log: typing.Callable[[str], None] = print,
+        name_filter: typing.Optional[str] = None,
+        ) -> Results:
+    """
+    Runs all benchmarks
+
+    :param registry_sizes: numbers of config values to declare
+    :param file_sizes: sizes of config files to parse, in bytes
+    :param log: callable used to report progress
+    :param name_filter: if given, only run benchmarks whose name matches this regular expression
+    :return: results, indexed by benchmark name
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        suite = _Suite(temp_dir, log, name_filter)
+        suite.bench_calls()
+        suite.bench_table_schema()
+        suite.bench_lists()
+        for count in registry_sizes:
+            for shape in (FLAT, DEEP):
+                suite.bench_registry(count, shape)
+        for size in file_sizes:
+            suite.bench_read(size)
+        ConfigValue.config_values.clear()
+        return suite.results
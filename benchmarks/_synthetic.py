@@ -0,0 +1,98 @@
+# coding=utf-8
+"""
+Generates synthetic registries of config values, and matching config files
+"""
+import typing
+
+import elib_config
+# noinspection PyProtectedMember
+from elib_config._value._config_value import ConfigValue
+
+FLAT = 'flat'
+DEEP = 'deep'
+_DEEP_LEVELS = 4
+_DEEP_FAN_OUT = 8
+
+_TABLE_KEYS = (
+    elib_config.ConfigValueTableKey('name', str, 'name'),
+    elib_config.ConfigValueTableKey('port', int, 'port', default=80),
+)
+
+# type of value: (factory, TOML literal of a valid value)
+VALUE_TYPES: typing.Dict[str, typing.Tuple[typing.Callable[..., ConfigValue], str]] = {
+    'bool': (lambda *path: elib_config.ConfigValueBool(*path, description='bool'), 'true'),
+    'string': (lambda *path: elib_config.ConfigValueString(*path, description='string'), '"some text"'),
+    'integer': (lambda *path: elib_config.ConfigValueInteger(*path, description='integer'), '10'),
+    'float': (lambda *path: elib_config.ConfigValueFloat(*path, description='float'), '10.5'),
+    'list': (lambda *path: elib_config.ConfigValueList(*path, element_type=int, description='list'), '[1, 2, 3]'),
+    'path': (lambda *path: elib_config.ConfigValuePath(*path, description='path'), '"."'),
+    'table': (
+        lambda *path: elib_config.ConfigValueTableArray(*path, description='table', keys=_TABLE_KEYS),
+        '{ name = "some name", port = 8080 }',
+    ),
+}
+
+
+def value_path(index: int, shape: str) -> typing.Tuple[str, ...]:
+    """
+    :param index: index of the value
+    :param shape: FLAT (all values in a single table) or DEEP (values nested in several levels of tables)
+    :return: path of the value
+    """
+    if shape == FLAT:
+        return 'bench', f'value_{index}'
+    tables = []
+    remainder = index
+    for level in range(_DEEP_LEVELS):
+        tables.append(f'level{level}_{remainder % _DEEP_FAN_OUT}')
+        remainder //= _DEEP_FAN_OUT
+    return (*tables, f'value_{index}')
+
+
+def create_registry(count: int, shape: str) -> typing.Tuple[typing.List[ConfigValue], str]:
+    """
+    Declares config values of all types, and builds a config file that provides a valid setting for each of them
+
+    :param count: number of values
+    :param shape: FLAT or DEEP
+    :return: declared values, and content of the matching config file
+    """
+    ConfigValue.config_values.clear()
+    type_names = list(VALUE_TYPES)
+    values = []
+    tables: typing.Dict[typing.Tuple[str, ...], typing.List[str]] = {}
+    for index in range(count):
+        factory, literal = VALUE_TYPES[type_names[index % len(type_names)]]
+        path = value_path(index, shape)
+        values.append(factory(*path))
+        tables.setdefault(path[:-1], []).append(f'{path[-1]} = {literal}')
+    lines = []
+    for table, table_lines in tables.items():
+        lines.append(f'[{".".join(table)}]')
+        lines.extend(table_lines)
+        lines.append('')
+    return values, '\n'.join(lines)
+
+
+def create_config_file_content(size: int) -> str:
+    """
+    :param size: approximate size of the file, in bytes
+    :return: content of a config file of (about) the given size
+    """
+    chunks = []
+    total = 0
+    index = 0
+    while total < size:
+        chunk = (
+            f'[table_{index}]\n'
+            f'string = "some text for table {index}"\n'
+            f'integer = {index}\n'
+            f'float = {index}.5\n'
+            f'bool = true\n'
+            f'list = [1, 2, 3, 4, 5]\n'
+            f'inline = {{ name = "name {index}", port = {index % 65535} }}\n\n'
+        )
+        chunks.append(chunk)
+        total += len(chunk)
+        index += 1
+    return ''.join(chunks)
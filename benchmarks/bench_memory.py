@@ -0,0 +1,84 @@
+# coding=utf-8
+"""
+Measures the memory used by declared config values
+
+Memory is measured for the elib_config package that is importable, so that another version can be measured by putting
+it first on the path, and the results compared::
+
+    PYTHONPATH=path/to/baseline/checkout python benchmarks/bench_memory.py --output baseline.json
+    python benchmarks/bench_memory.py --compare baseline.json
+
+A subclass without __slots__ is not a fair stand-in for an older layout: it still carries the inherited slots on top
+of its __dict__, so the baseline has to be measured on the older code itself.
+"""
+import argparse
+import gc
+import json
+import tracemalloc
+import typing
+
+import elib_config
+# noinspection PyProtectedMember
+from elib_config._value._config_value import ConfigValue
+
+_VALUES_COUNT = 10000
+
+_FACTORIES: typing.Dict[typing.Type[ConfigValue], typing.Callable[[typing.Type[ConfigValue], str], ConfigValue]] = {
+    elib_config.ConfigValueBool: lambda cls, name: cls('bench', name, description='desc', default=True),
+    elib_config.ConfigValueString: lambda cls, name: cls('bench', name, description='desc', default='text'),
+    elib_config.ConfigValueInteger: lambda cls, name: cls('bench', name, description='desc', default=1),
+    elib_config.ConfigValueFloat: lambda cls, name: cls('bench', name, description='desc', default=1.0),
+    elib_config.ConfigValueList: lambda cls, name: cls('bench', name, element_type=int, description='desc'),
+    elib_config.ConfigValuePath: lambda cls, name: cls('bench', name, description='desc', default='.'),
+    elib_config.ConfigValueTableArray: lambda cls, name: cls('bench', name, description='desc'),
+}
+
+
+def _bytes_per_value(value_cls: typing.Type[ConfigValue], factory) -> float:
+    names = [f'value_{index}' for index in range(_VALUES_COUNT)]
+    ConfigValue.config_values.clear()
+    gc.collect()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    values = [factory(value_cls, name) for name in names]
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # the registry holds references to the values too, its memory is counted as well
+    del values
+    ConfigValue.config_values.clear()
+    return (end - start) / _VALUES_COUNT
+
+
+def main(argv: typing.Optional[typing.List[str]] = None):
+    """
+    Runs the benchmark and prints the results
+
+    :param argv: command line arguments
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--output', help='file to write results to')
+    parser.add_argument('--compare', metavar='BASELINE', help='results of a baseline to compare to')
+    args = parser.parse_args(argv)
+
+    elib_config.ELIBConfig.setup(
+        app_version='0.1',
+        app_name='bench',
+        config_file_path='config.toml',
+        config_sep_str='__',
+    )
+    results = {value_cls.__name__: _bytes_per_value(value_cls, factory) for value_cls, factory in _FACTORIES.items()}
+    if args.output:
+        with open(args.output, 'w', encoding='utf8') as stream:
+            json.dump(results, stream, indent=2, sort_keys=True)
+    baseline: typing.Dict[str, float] = {}
+    if args.compare:
+        with open(args.compare, encoding='utf8') as stream:
+            baseline = json.load(stream)
+    print(f'{"type":<25}{"baseline":>12}{"current":>12}  (bytes per declared value)')
+    for name, current in results.items():
+        before = f'{baseline[name]:.0f}' if name in baseline else '-'
+        print(f'{name:<25}{before:>12}{current:>12.0f}')
+
+
+if __name__ == '__main__':
+    main()
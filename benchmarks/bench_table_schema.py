@@ -0,0 +1,68 @@
+# coding=utf-8
+"""
+Measures the compiled table validator against a generic loop over the keys of a wide table
+"""
+import timeit
+import typing
+
+from elib_config import ConfigValueTableKey, MissingTableKeyError, TableKeyTypeError
+# noinspection PyProtectedMember
+from elib_config._utils import friendly_type_name
+# noinspection PyProtectedMember
+from elib_config._value._table_schema import compile_table_validator
+
+_ITERATIONS = 20000
+_KEY_TYPES = (str, int, float, bool)
+
+
+def wide_table_schema(count: int) -> typing.Tuple[typing.Tuple[ConfigValueTableKey, ...], dict]:
+    """
+    :param count: number of keys
+    :return: keys of the table (one in four is optional and missing), and a matching raw table
+    """
+    keys = []
+    raw_table: typing.Dict[str, typing.Any] = {}
+    for index in range(count):
+        key_type = _KEY_TYPES[index % len(_KEY_TYPES)]
+        if index % 4 == 3:
+            keys.append(ConfigValueTableKey(f'key_{index}', key_type, description='', default=key_type()))
+        else:
+            keys.append(ConfigValueTableKey(f'key_{index}', key_type, description=''))
+            raw_table[f'key_{index}'] = key_type()
+    return tuple(keys), raw_table
+
+
+def _generic_validator(keys: typing.Sequence[ConfigValueTableKey]):
+    # the per-key loop the compiled validator replaces
+    def _validate(raw_table: dict, value_name: str) -> dict:
+        table = dict(raw_table)
+        for key in keys:
+            if key.key_name not in table:
+                if key.mandatory:
+                    raise MissingTableKeyError(value_name, str(key))
+                table[key.key_name] = key.default
+            key_value = table[key.key_name]
+            if not isinstance(key_value, key.key_type):
+                raise TableKeyTypeError(value_name, key.key_name, friendly_type_name(key.key_type),
+                                        friendly_type_name(type(key_value)))
+        return table
+
+    return _validate
+
+
+def main():
+    """
+    Runs the benchmark and prints the results
+    """
+    for count in (5, 20, 50):
+        keys, raw_table = wide_table_schema(count)
+        generic, compiled = _generic_validator(keys), compile_table_validator(keys)
+        assert generic(raw_table, 'bench') == compiled(raw_table, 'bench')
+        generic_time = timeit.timeit(lambda: generic(raw_table, 'bench'), number=_ITERATIONS) / _ITERATIONS
+        compiled_time = timeit.timeit(lambda: compiled(raw_table, 'bench'), number=_ITERATIONS) / _ITERATIONS
+        print(f'{count:>3} keys: generic {generic_time * 1e6:>8.2f} µs, compiled {compiled_time * 1e6:>8.2f} µs '
+              f'(x{generic_time / compiled_time:.1f})')
+
+
+if __name__ == '__main__':
+    main()
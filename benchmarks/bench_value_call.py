@@ -0,0 +1,63 @@
+# coding=utf-8
+"""
+Measures the cost of ConfigValue.__call__ with a warm and a cold config document cache
+"""
+import os
+import tempfile
+import timeit
+
+from elib_config import CachePolicy, ConfigValueInteger, ConfigValueString, ELIBConfig, invalidate
+
+_COLD_ITERATIONS = 50
+_WARM_ITERATIONS = 10000
+_VALUES_COUNT = 200
+
+
+def _write_config_file(config_file_path: str):
+    lines = ['[bench]']
+    for index in range(_VALUES_COUNT):
+        lines.append(f'string_{index} = "value {index}"')
+        lines.append(f'integer_{index} = {index}')
+    with open(config_file_path, 'w') as stream:
+        stream.write('\n'.join(lines))
+
+
+def _report(label: str, total: float, calls: int):
+    print(f'{label:<30}{total / calls * 1e6:>12.2f} µs/call')
+
+
+def main():
+    """
+    Runs the benchmark and prints the results
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        config_file_path = os.path.join(temp_dir, 'config.toml')
+        _write_config_file(config_file_path)
+        ELIBConfig.setup(
+            app_version='0.1',
+            app_name='bench',
+            config_file_path=config_file_path,
+            config_sep_str='__',
+        )
+        string_value = ConfigValueString('bench', 'string_0', description='')
+        integer_value = ConfigValueInteger('bench', 'integer_0', description='')
+
+        def _cold():
+            invalidate()
+            string_value()
+            invalidate()
+            integer_value()
+
+        def _warm():
+            string_value()
+            integer_value()
+
+        _report('__call__ (cold cache)', timeit.timeit(_cold, number=_COLD_ITERATIONS), _COLD_ITERATIONS * 2)
+        _report('__call__ (warm cache)', timeit.timeit(_warm, number=_WARM_ITERATIONS), _WARM_ITERATIONS * 2)
+        string_value.set_cache_policy(CachePolicy.generation)
+        integer_value.set_cache_policy(CachePolicy.generation)
+        _report('__call__ (cached value)', timeit.timeit(_warm, number=_WARM_ITERATIONS), _WARM_ITERATIONS * 2)
+
+
+if __name__ == '__main__':
+    main()
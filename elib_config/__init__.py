@@ -3,46 +3,93 @@
 This package manages configuration for other packages.
 
 It is intended for my personal use only
+
+The public names of the package are imported lazily, the first time they are accessed, to keep the import of the
+package itself cheap.
 """
+import importlib
+import sys
+import typing
+
+_LAZY_IMPORTS: typing.Dict[str, str] = {
+    'ConfigFileNotFoundError': 'elib_config._file._exc',
+    'EmptyValueError': 'elib_config._file._exc',
+    'IncompleteSetupError': 'elib_config._file._exc',
+    'Types': 'elib_config._types',
+    'ConfigMissingValueError': 'elib_config._value._exc',
+    'ConfigValueError': 'elib_config._value._exc',
+    'ConfigValueTypeError': 'elib_config._value._exc',
+    'DuplicateConfigValueError': 'elib_config._value._exc',
+    'DuplicateTableIndexError': 'elib_config._value._exc',
+    'MissingTableKeyError': 'elib_config._value._exc',
+    'MissingValueError': 'elib_config._value._exc',
+    'NotAFileError': 'elib_config._value._exc',
+    'NotAFolderError': 'elib_config._value._exc',
+    'OutOfBoundError': 'elib_config._value._exc',
+    'PathMustExistError': 'elib_config._value._exc',
+    'TableKeyTypeError': 'elib_config._value._exc',
+    'refresh_environ': 'elib_config._environ',
+    'stream_example_config': 'elib_config._file._config_example',
+    'write_example_config': 'elib_config._file._config_example',
+    'invalidate': 'elib_config._file._config_file',
+    'transaction': 'elib_config._file._transaction',
+    'LOGGER': 'elib_config._logging',
+    'ELIBConfig': 'elib_config._setup',
+    'collect_config_errors': 'elib_config._validate',
+    'validate_config': 'elib_config._validate',
+    'CachePolicy': 'elib_config._value._config_value',
+    'SENTINEL': 'elib_config._value._config_value',
+    'ConfigValueBool': 'elib_config._value._config_value_bool',
+    'ConfigValueFloat': 'elib_config._value._config_value_float',
+    'ConfigValueInteger': 'elib_config._value._config_value_integer',
+    'ConfigValueList': 'elib_config._value._config_value_list',
+    'ConfigValuePath': 'elib_config._value._config_value_path',
+    'ConfigValueSet': 'elib_config._value._config_value_set',
+    'ConfigValueString': 'elib_config._value._config_value_string',
+    'ConfigValueTableArray': 'elib_config._value._config_value_table',
+    'ConfigValueTableKey': 'elib_config._value._config_value_table',
+    'TableArray': 'elib_config._value._table_array',
+    'TableIndex': 'elib_config._value._table_array',
+}
+
+__all__ = sorted(_LAZY_IMPORTS)
+
+
+def _get_version() -> str:
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:  # pragma: no cover
+        # Python < 3.8
+        from pkg_resources import DistributionNotFound as PackageNotFoundError, get_distribution
+
+        def version(distribution_name: str) -> str:
+            """Fallback for importlib.metadata.version"""
+            return get_distribution(distribution_name).version
+    try:
+        return version('elib_config')
+    except PackageNotFoundError:  # pragma: no cover
+        # package is not installed
+        return 'not installed'
+
+
+def __getattr__(name: str) -> typing.Any:
+    if name == '__version__':
+        value: typing.Any = _get_version()
+    else:
+        try:
+            module_name = _LAZY_IMPORTS[name]
+        except KeyError:
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+        value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS) | {'__version__'})
+
 
-from pkg_resources import DistributionNotFound, get_distribution
-
-# noinspection PyProtectedMember
-from elib_config._file._exc import (
-    ConfigFileNotFoundError, EmptyValueError, IncompleteSetupError,
-)
-# noinspection PyProtectedMember
-from elib_config._types import Types
-# noinspection PyProtectedMember
-from elib_config._value._exc import (
-    ConfigMissingValueError, ConfigValueError, ConfigValueTypeError, DuplicateConfigValueError, MissingTableKeyError,
-    MissingValueError, NotAFileError, NotAFolderError, OutOfBoundError, PathMustExistError, TableKeyTypeError,
-)
-# noinspection PyProtectedMember
-from ._file._config_example import write_example_config
-# noinspection PyProtectedMember
-from ._logging import LOGGER
-from ._setup import ELIBConfig
-from ._validate import validate_config
-# noinspection PyProtectedMember
-from ._value._config_value import SENTINEL
-# noinspection PyProtectedMember
-from ._value._config_value_bool import ConfigValueBool
-# noinspection PyProtectedMember
-from ._value._config_value_float import ConfigValueFloat
-# noinspection PyProtectedMember
-from ._value._config_value_integer import ConfigValueInteger
-# noinspection PyProtectedMember
-from ._value._config_value_list import ConfigValueList
-# noinspection PyProtectedMember
-from ._value._config_value_path import ConfigValuePath
-# noinspection PyProtectedMember
-from ._value._config_value_string import ConfigValueString
-# noinspection PyProtectedMember
-from ._value._config_value_table import ConfigValueTableArray, ConfigValueTableKey
-
-try:
-    __version__ = get_distribution('elib_config').version
-except DistributionNotFound:  # pragma: no cover
-    # package is not installed
-    __version__ = 'not installed'
+if sys.version_info < (3, 7):  # pragma: no cover
+    # module level __getattr__ is not supported (PEP 562)
+    for _name in [*_LAZY_IMPORTS, '__version__']:
+        __getattr__(_name)
@@ -0,0 +1,78 @@
+# coding=utf-8
+"""
+Case-insensitive index of the OS environment
+
+Config values are looked up in the OS environment regardless of the case of the variables names. Instead of scanning
+the whole environment for every lookup, the upper-cased names are indexed once, and the index is rebuilt when the
+number of variables in the environment changes, or when a lookup shows that the index is out of date.
+
+Replacing a variable by another one (keeping the size of the environment intact) is detected as long as the new
+variable is named in upper case; for other names, use :py:func:`refresh_environ` after such changes.
+
+:py:func:`check_environ` detects any change, including changes of values, at the cost of a pass over the whole
+environment.
+"""
+import os
+import typing
+
+from elib_config._generation import ConfigGeneration
+
+_INDEX: typing.Dict[str, str] = {}
+_INDEX_SIZE: int = -1
+_FINGERPRINT: int = 0
+
+
+def refresh_environ():
+    """
+    Rebuilds the index of the OS environment
+    """
+    global _INDEX, _INDEX_SIZE, _FINGERPRINT  # pylint: disable=global-statement
+    index: typing.Dict[str, str] = {}
+    for env_var in os.environ:
+        index.setdefault(env_var.upper(), env_var)
+    _INDEX, _INDEX_SIZE, _FINGERPRINT = index, len(os.environ), _fingerprint()
+    ConfigGeneration.bump()
+
+
+def _fingerprint() -> int:
+    return hash(tuple(os.environ.items()))
+
+
+def check_environ():
+    """
+    Rebuilds the index of the OS environment if any variable has been added, removed or changed since it was built
+    """
+    if _fingerprint() != _FINGERPRINT:
+        refresh_environ()
+
+
+def environ_snapshot() -> typing.Dict[str, str]:
+    """
+    :return: copy of the OS environment, with upper-cased variables names
+    """
+    snapshot: typing.Dict[str, str] = {}
+    for env_var, value in os.environ.items():
+        snapshot.setdefault(env_var.upper(), value)
+    return snapshot
+
+
+def getenv(var_name: str) -> typing.Optional[str]:
+    """
+    Case-insensitive lookup in the OS environment
+
+    :param var_name: name of the variable, in upper case
+    :return: value of the variable, or None if it does not exist
+    """
+    if len(os.environ) != _INDEX_SIZE:
+        refresh_environ()
+    env_var = _INDEX.get(var_name)
+    if env_var is not None:
+        value = os.environ.get(env_var)
+        if value is not None:
+            return value
+    elif var_name not in os.environ:
+        return None
+    # the index is out of date: a variable has been replaced by another one since it was built
+    refresh_environ()
+    env_var = _INDEX.get(var_name)
+    return None if env_var is None else os.environ.get(env_var)
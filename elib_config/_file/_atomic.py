@@ -0,0 +1,49 @@
+# coding=utf-8
+"""
+Atomic file writes: readers see either the previous content of a file, or its new content, never a partial write
+
+The permissions of the file being replaced are carried over to its new content.
+"""
+import contextlib
+import os
+import stat
+import typing
+import uuid
+
+
+@contextlib.contextmanager
+def open_atomically(file_path: str) -> typing.Iterator[typing.TextIO]:
+    """
+    Opens a temporary file next to the target for writing, and replaces the target with it once the block exits
+
+    If the block raises, the temporary file is removed and the target is left untouched.
+
+    :param file_path: path of the file to write
+    :return: text stream to write to
+    """
+    temp_file_path = f'{file_path}.{uuid.uuid4().hex}.tmp'
+    try:
+        with open(temp_file_path, 'x', encoding='utf8') as stream:
+            yield stream
+            stream.flush()
+            os.fsync(stream.fileno())
+        try:
+            os.chmod(temp_file_path, stat.S_IMODE(os.stat(file_path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(temp_file_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_file_path):
+            os.remove(temp_file_path)
+        raise
+
+
+def write_atomically(file_path: str, content: str):
+    """
+    Writes text to a temporary file next to the target, then replaces the target with it
+
+    :param file_path: path of the file to write
+    :param content: text to write
+    """
+    with open_atomically(file_path) as stream:
+        stream.write(content)
@@ -1,84 +1,149 @@
 # coding=utf-8
 """
 This module is responsible for writing an example config file in case it is missing or incorrect
+
+The example is streamed as text, one value at a time, so that memory use does not depend on the number of values.
+Within each table, plain values come first and sub-tables last, as required by TOML for the values to belong to the
+right table.
+
+The header of the example holds a fingerprint of everything the example depends on; an existing example with the same
+fingerprint is left untouched, and a different one is replaced atomically.
 """
+import hashlib
 import typing
-import uuid
-from collections import defaultdict
-
-import tomlkit
-from tomlkit.container import Container as TOMLContainer
 
+from elib_config._file._atomic import open_atomically
 from elib_config._file._config_example_header import HEADER
 # noinspection PyProtectedMember
 from elib_config._setup import ELIBConfig
 # noinspection PyProtectedMember
 from elib_config._value._config_value import ConfigValue
-
-_NOT_SET = uuid.uuid4().hex
-
-
-def _nested_default_dict() -> defaultdict:
-    return defaultdict(_nested_default_dict)
+# noinspection PyProtectedMember
+from elib_config._value._registry import ConfigValueRegistry, aggregate_config_values
+# noinspection PyProtectedMember
+from elib_config._value._toml_render import render_key
 
 
-def _default_dict_to_dict(source) -> dict:
-    for key, value in source.items():
-        if isinstance(value, dict):
-            source[key] = _default_dict_to_dict(value)
-    return dict(source)
+# bump when the layout of the example changes, so existing examples get rewritten
+_EXAMPLE_FORMAT = '2'
+_FINGERPRINT_PREFIX = '# Fingerprint of this example (do not edit): '
+_START_MARKER = 'START OF ACTUAL CONFIG FILE'
 
 
-def _get_header() -> typing.List[str]:
+def _get_header(fingerprint: str) -> typing.List[str]:
     return HEADER.format(
         app_version=ELIBConfig.app_version,
         app_name=ELIBConfig.app_name,
         config_file_path=ELIBConfig.config_file_path,
         sep=ELIBConfig.config_sep_str,
-    ).split('\n') + ['', 'START OF ACTUAL CONFIG FILE']
+        fingerprint=fingerprint,
+    ).split('\n') + ['', _START_MARKER]
 
 
-def _aggregate_config_values(config_values: typing.List[ConfigValue]) -> dict:
+def _aggregate_config_values(config_values: typing.Iterable[ConfigValue]) -> dict:
     """
-    Returns a (sorted)
+    Returns a (sorted) tree of config values, indexed by path components
 
-    :param config_values:
-    :type config_values:
-    :return:
-    :rtype:
+    The tree of the registry of config values is cached by the registry itself.
+
+    :param config_values: config values to aggregate
+    :return: nested dictionaries of config values
     """
-    _keys: defaultdict = _nested_default_dict()
-    _sorted_values = sorted(config_values, key=lambda x: x.name)
-    for value in _sorted_values:
-        value_keys = value.path.split(ELIBConfig.config_sep_str)
-        this_config_key = _keys
-        for sub_key in value_keys[:-1]:
-            this_config_key = this_config_key[sub_key]
-        this_config_key[value_keys[-1]] = value
-    return _default_dict_to_dict(_keys)
-
-
-def _add_config_values_to_toml_object(toml_obj: TOMLContainer, data: typing.Dict[str, typing.Union[dict, ConfigValue]]):
+    if isinstance(config_values, ConfigValueRegistry):
+        return config_values.tree()
+    return aggregate_config_values(config_values)
+
+
+def _write_lines(stream: typing.TextIO, lines: typing.Iterable[str]):
+    stream.write(''.join(f'{line}\n' for line in lines))
+
+
+def _write_config_values(stream: typing.TextIO,
+                         data: typing.Dict[str, typing.Union[dict, ConfigValue]],
+                         table_name: typing.Optional[str] = None):
+    is_empty = table_name is not None
+    for key_data in data.values():
+        if not isinstance(key_data, dict):
+            lines: typing.List[str] = []
+            key_data.add_to_example(lines)
+            _write_lines(stream, lines)
+            is_empty = False
     for key_name, key_data in data.items():
         if isinstance(key_data, dict):
-            table = tomlkit.table()
-            _add_config_values_to_toml_object(table, key_data)
-            toml_obj[key_name] = table
-        else:
-            key_data.add_to_toml_obj(toml_obj, _NOT_SET)
+            sub_table_name = render_key(key_name) if table_name is None else f'{table_name}.{render_key(key_name)}'
+            if not is_empty:
+                # blank line before a table header, unless the header directly follows the header of its parent
+                stream.write('\n')
+            stream.write(f'[{sub_table_name}]\n')
+            _write_config_values(stream, key_data, sub_table_name)
+            is_empty = False
+
+
+def _fingerprint(config_keys: typing.Dict[str, typing.Union[dict, ConfigValue]]) -> str:
+    digest = hashlib.sha256(_EXAMPLE_FORMAT.encode())
+    digest.update('\n'.join(_get_header('')).encode('utf8', 'surrogatepass'))
+
+    def _update(data: typing.Dict[str, typing.Union[dict, ConfigValue]]):
+        for key_name, key_data in data.items():
+            digest.update(f'\x00{key_name}\x00'.encode('utf8', 'surrogatepass'))
+            if isinstance(key_data, dict):
+                digest.update(b'\x02')
+                _update(key_data)
+                digest.update(b'\x03')
+            else:
+                # noinspection PyProtectedMember
+                fingerprint = key_data._example_fingerprint()  # pylint: disable=protected-access
+                digest.update(fingerprint.encode('utf8', 'surrogatepass'))
+
+    _update(config_keys)
+    return digest.hexdigest()
+
+
+def _read_fingerprint(example_file_path: str) -> typing.Optional[str]:
+    try:
+        with open(example_file_path, encoding='utf8') as stream:
+            for line in stream:
+                if line.startswith(_FINGERPRINT_PREFIX):
+                    return line[len(_FINGERPRINT_PREFIX):].rstrip('\n')
+                if _START_MARKER in line:
+                    break
+    except (OSError, UnicodeDecodeError):
+        pass
+    return None
+
+
+def _write_example(stream: typing.TextIO,
+                   config_keys: typing.Dict[str, typing.Union[dict, ConfigValue]],
+                   fingerprint: str):
+    _write_lines(stream, (f'# {header_line}' for header_line in _get_header(fingerprint)))
+    _write_config_values(stream, config_keys)
+
+
+def stream_example_config(stream: typing.TextIO):
+    """
+    Writes an example config file using the config values declared so far to a text stream
 
+    The example is written as it is generated, one value at a time.
 
-def write_example_config(example_file_path: str):
+    :param stream: writable text stream, for example an open file or sys.stdout
+    """
+    config_keys = _aggregate_config_values(ConfigValue.config_values)
+    _write_example(stream, config_keys, _fingerprint(config_keys))
+
+
+def write_example_config(example_file_path: str) -> bool:
     """
     Writes an example config file using the config values declared so far
 
+    Nothing is written if the existing example already matches the config values declared so far.
+
     :param example_file_path: path to write to
+    :return: True if the example has been written, False if it was up to date
     """
-    document = tomlkit.document()
-    for header_line in _get_header():
-        document.add(tomlkit.comment(header_line))
     config_keys = _aggregate_config_values(ConfigValue.config_values)
-    _add_config_values_to_toml_object(document, config_keys)
-    _doc_as_str = document.as_string().replace(f'"{_NOT_SET}"', '')
-    with open(example_file_path, 'w') as stream:
-        stream.write(_doc_as_str)
+    fingerprint = _fingerprint(config_keys)
+    if _read_fingerprint(example_file_path) == fingerprint:
+        return False
+    with open_atomically(example_file_path) as stream:
+        _write_example(stream, config_keys, fingerprint)
+    return True
@@ -7,11 +7,12 @@ Header template for the example config file
 
 HEADER = r'''{app_name} {app_version}.
 
-WARNING: this example file will be overwritten every time {app_name} starts.
-Make sure to save your work and rename the file when you are done!
+WARNING: this example file will be overwritten every time {app_name} starts with a different set of
+configuration values. Make sure to save your work and rename the file when you are done!
 
 It must be renamed to "{config_file_path}" in order to come into effect.
 
 The full TOML specification can be found at: https://github.com/toml-lang/toml
+Fingerprint of this example (do not edit): {fingerprint}
 ####################################################################
 '''
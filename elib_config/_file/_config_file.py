@@ -1,21 +1,56 @@
 # coding=utf-8
 """
 Reads and writes ESST's config to/from a file.
+
+Parsed documents are cached per config file, and only re-parsed when the file on disk actually changes (as
+reported by its modification time, size and inode).
+
+Reading only needs plain Python objects, so the config file is parsed with :py:mod:`tomllib` (or ``tomli``, if
+installed) when available. tomlkit, which preserves style and comments, is used to write files, and to report
+errors in invalid config files.
+
+Parsers are only imported when they are first needed.
+
+Access to the config file is guarded by :py:data:`CONFIG_LOCK`: reads are shared, writes are exclusive, and the
+config file is replaced atomically so that readers never see a partially written file.
 """
-import multiprocessing
+import functools
+import os
 import typing
 from pathlib import Path
 
-import tomlkit
-import tomlkit.exceptions
-
+from elib_config._generation import ConfigGeneration
 # noinspection PyProtectedMember
 from elib_config._setup import ELIBConfig
+from ._atomic import write_atomically
 # noinspection PyProtectedMember
 from ._exc import ConfigFileNotFoundError, EmptyValueError
+from ._lock import ConfigLock
+
+
+_CacheKey = typing.Tuple[int, int, int]
+_DOCUMENT_CACHE: typing.Dict[str, typing.Tuple[_CacheKey, typing.MutableMapping[str, typing.Any]]] = {}
+"""Parsed config documents, indexed by absolute path of the config file"""
 
-CONFIG_LOCK = multiprocessing.RLock()
-""":py:class:`multiprocessing.RLock` that blocks concurrent access to the config file by multiple processes"""
+
+CONFIG_LOCK = ConfigLock()
+"""Reader/writer lock guarding the config file against concurrent access by threads and processes"""
+
+
+@functools.lru_cache(maxsize=None)
+def _toml_reader() -> typing.Any:
+    """
+    :return: the fastest plain TOML reader module available, or None
+    """
+    try:
+        import tomllib
+        return tomllib
+    except ImportError:  # pragma: no cover
+        try:
+            import tomli
+            return tomli
+        except ImportError:
+            return None
 
 
 def _ensure_config_file_exists():
@@ -29,33 +64,91 @@ def _ensure_config_file_exists():
         raise ConfigFileNotFoundError(ELIBConfig.config_file_path)
 
 
+def _to_plain(value: typing.Any) -> typing.Any:
+    """
+    Recursively converts tomlkit items to their plain Python counterparts
+    """
+    if isinstance(value, dict):
+        return {key: _to_plain(sub_value) for key, sub_value in value.items()}
+    if isinstance(value, list):
+        return [_to_plain(sub_value) for sub_value in value]
+    if isinstance(value, bool):
+        return value
+    for plain_type in (str, int, float):
+        if isinstance(value, plain_type):
+            return plain_type(value)
+    return value
+
+
+def _parse_with_tomlkit(content: str, config_file: Path) -> typing.MutableMapping[str, typing.Any]:
+    import tomlkit
+    import tomlkit.exceptions
+    try:
+        return tomlkit.parse(content)
+    except tomlkit.exceptions.UnexpectedCharError as err:
+        if r"Unexpected character: '\n'" in err.args[0]:
+            # noinspection PyProtectedMember
+            raise EmptyValueError(str(config_file), err._line)  # pylint: disable=protected-access
+        else:
+            raise
+
+
 def _read_file() -> typing.MutableMapping[str, typing.Any]:
     config_file = Path(ELIBConfig.config_file_path).absolute()
     if not config_file.exists():
         return {}
-    with config_file.open(encoding='utf8') as stream:
+    with CONFIG_LOCK.read(), config_file.open(encoding='utf8') as stream:
+        content = stream.read()
+    toml_reader = _toml_reader()
+    if toml_reader is not None:
         try:
-            return tomlkit.parse(stream.read())
-        except tomlkit.exceptions.UnexpectedCharError as err:
-            if r"Unexpected character: '\n'" in err.args[0]:
-                # noinspection PyProtectedMember
-                raise EmptyValueError(str(config_file), err._line)  # pylint: disable=protected-access
-            else:
-                raise
+            return toml_reader.loads(content)
+        except toml_reader.TOMLDecodeError:
+            # tomlkit gives better diagnostics, and is a bit more lenient; let it have a go at the file
+            pass
+    return _to_plain(_parse_with_tomlkit(content, config_file))
 
 
 def _write_file(config: dict):
+    import tomlkit
     config_file = Path(ELIBConfig.config_file_path).absolute()
-    with config_file.open(mode='w', encoding='utf8') as stream:
-        stream.write(tomlkit.dumps(config))
+    content = tomlkit.dumps(config)
+    with CONFIG_LOCK.write():
+        write_atomically(str(config_file), content)
+    invalidate()
+
+
+def invalidate():
+    """
+    Drops all cached config documents, forcing the next read to parse the config file again
+    """
+    _DOCUMENT_CACHE.clear()
+    ConfigGeneration.bump()
 
 
 def read_config_file() -> typing.MutableMapping[str, typing.Any]:
     """
     Reads configuration from the disk.
 
+    The parsed document is cached, and shared between callers; it must not be mutated.
+
     :return: configuration dictionary.
     :raises MissingConfigPackageError: raised if ``package`` is not ``None`` and it doesn't exist at the top level of
         the config file.
     """
-    return _read_file()
+    config_file = os.path.abspath(ELIBConfig.config_file_path)
+    try:
+        stat = os.stat(config_file)
+    except FileNotFoundError:
+        if _DOCUMENT_CACHE.pop(config_file, None) is not None:
+            # the config file has been removed
+            ConfigGeneration.bump()
+        return {}
+    cache_key = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _DOCUMENT_CACHE.get(config_file)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+    document = _read_file()
+    _DOCUMENT_CACHE[config_file] = (cache_key, document)
+    ConfigGeneration.bump()
+    return document
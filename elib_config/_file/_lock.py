@@ -0,0 +1,160 @@
+# coding=utf-8
+"""
+Reader/writer lock for the config file
+
+Within a process, any number of threads can read the config file at the same time, while writes are exclusive; a
+waiting writer prevents new readers from getting in, so that writers are not starved.
+
+Across processes, the same scheme is enforced with an advisory lock on a ".lock" file next to the config file
+(:py:func:`fcntl.flock` on POSIX). On Windows, :py:func:`msvcrt.locking` only offers exclusive locks, so reads are
+exclusive across processes there.
+
+The lock is re-entrant: a thread that holds it can take it again, and a writer can also read. A reader cannot become
+a writer though, as two readers doing so at the same time would wait for each other forever.
+"""
+import contextlib
+import os
+import threading
+import typing
+
+from elib_config._setup import ELIBConfig
+
+
+def _lock_stream(stream: typing.IO, exclusive: bool):
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover
+        import msvcrt
+        while True:
+            try:
+                # LK_LOCK retries for 10 seconds before giving up
+                msvcrt.locking(stream.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+    else:
+        fcntl.flock(stream.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+
+
+def _unlock_stream(stream: typing.IO):
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover
+        import msvcrt
+        stream.seek(0)
+        msvcrt.locking(stream.fileno(), msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(stream.fileno(), fcntl.LOCK_UN)
+
+
+class ConfigLock:
+    """
+    Reader/writer lock protecting the config file against concurrent access by threads and processes
+    """
+    __slots__ = ('_condition', '_readers', '_writer', '_waiting_writers', '_owners', '_lock_file')
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition(threading.Lock())
+        self._readers: int = 0
+        self._writer: typing.Optional[int] = None
+        self._waiting_writers: int = 0
+        self._owners = threading.local()
+        self._lock_file: typing.Optional[typing.IO] = None
+
+    @property
+    def _depth(self) -> int:
+        return getattr(self._owners, 'depth', 0)
+
+    @_depth.setter
+    def _depth(self, value: int):
+        self._owners.depth = value
+
+    def _lock_process(self, exclusive: bool):
+        lock_file_path = f'{os.path.abspath(ELIBConfig.config_file_path)}.lock'
+        try:
+            stream = open(lock_file_path, 'a+')
+        except OSError:
+            # the folder of the config file is not writable (or does not exist): there is nothing to lock
+            return
+        try:
+            _lock_stream(stream, exclusive)
+        except BaseException:
+            stream.close()
+            raise
+        self._lock_file = stream
+
+    def _unlock_process(self):
+        stream, self._lock_file = self._lock_file, None
+        if stream is not None:
+            try:
+                _unlock_stream(stream)
+            finally:
+                stream.close()
+
+    @contextlib.contextmanager
+    def read(self) -> typing.Iterator[None]:
+        """
+        Holds the lock for reading: other readers can hold it at the same time, writers cannot
+        """
+        if self._depth:
+            # this thread already holds the lock, for reading or writing
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            if not self._readers:
+                self._lock_process(exclusive=False)
+            self._readers += 1
+        self._depth = 1
+        try:
+            yield
+        finally:
+            self._depth = 0
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._unlock_process()
+                    self._condition.notify_all()
+
+    @contextlib.contextmanager
+    def write(self) -> typing.Iterator[None]:
+        """
+        Holds the lock for writing: no other reader or writer can hold it at the same time
+
+        :raises RuntimeError: if this thread holds the lock for reading only
+        """
+        thread_id = threading.get_ident()
+        if self._writer == thread_id:
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+            return
+        if self._depth:
+            raise RuntimeError('cannot write to the config file while reading it')
+        with self._condition:
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+                self._lock_process(exclusive=True)
+            finally:
+                self._waiting_writers -= 1
+                # readers waiting on this writer may proceed if it gave up
+                self._condition.notify_all()
+            self._writer = thread_id
+        self._depth = 1
+        try:
+            yield
+        finally:
+            self._depth = 0
+            with self._condition:
+                self._writer = None
+                self._unlock_process()
+                self._condition.notify_all()
@@ -0,0 +1,94 @@
+# coding=utf-8
+"""
+Batched updates of the config file
+
+Updates are applied to a single tomlkit document, which preserves the comments and the layout of the config file,
+and are written with a single atomic write once the outermost transaction completes. If the transaction raises, the
+config file is left untouched.
+
+The config file is locked for writing for the whole duration of a transaction.
+"""
+import contextlib
+import threading
+import typing
+from pathlib import Path
+
+# noinspection PyProtectedMember
+from elib_config._setup import ELIBConfig
+# noinspection PyProtectedMember
+from elib_config._value._exc import ConfigValueTypeError
+from ._config_file import CONFIG_LOCK, _parse_with_tomlkit, _write_file
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from elib_config._value._config_value import ConfigValue  # noqa: F401 pylint: disable=unused-import
+
+_CURRENT = threading.local()
+
+
+class Transaction:
+    """
+    Pending updates of the config file
+    """
+    __slots__ = ('_document', '_updated_values')
+
+    def __init__(self) -> None:
+        import tomlkit
+        config_file = Path(ELIBConfig.config_file_path).absolute()
+        if config_file.exists():
+            self._document = _parse_with_tomlkit(config_file.read_text(encoding='utf8'), config_file)
+        else:
+            self._document = tomlkit.document()
+        self._updated_values: typing.List['ConfigValue'] = []
+
+    def set(self, config_value: 'ConfigValue', value: typing.Any):
+        """
+        Sets a value in the config file, once the transaction completes
+
+        :param config_value: config value to set
+        :param value: new value (already checked, and converted to a TOML value)
+        :raises ConfigValueTypeError: if a parent of the value is not a table in the config file
+        """
+        import tomlkit
+        *table_keys, key = config_value.path_keys
+        table = self._document
+        for index, table_key in enumerate(table_keys):
+            if table_key not in table:
+                table[table_key] = tomlkit.table()
+            table = table[table_key]
+            if not isinstance(table, dict):
+                parent = '.'.join(table_keys[:index + 1])
+                raise ConfigValueTypeError(config_value.path, f'cannot set this value: "{parent}" is not a table')
+        table[key] = value
+        self._updated_values.append(config_value)
+
+    def commit(self):
+        """
+        Writes the config file, if anything has been updated
+        """
+        if not self._updated_values:
+            return
+        _write_file(self._document)
+        for config_value in self._updated_values:
+            config_value.clear_cache()
+
+
+@contextlib.contextmanager
+def transaction() -> typing.Iterator[Transaction]:
+    """
+    Batches updates of config values (see :py:meth:`ConfigValue.set`) into a single write of the config file
+
+    Nested transactions are part of the outermost one.
+
+    :return: the current transaction
+    """
+    current: typing.Optional[Transaction] = getattr(_CURRENT, 'transaction', None)
+    if current is not None:
+        yield current
+        return
+    with CONFIG_LOCK.write():
+        current = _CURRENT.transaction = Transaction()
+        try:
+            yield current
+        finally:
+            _CURRENT.transaction = None
+        current.commit()
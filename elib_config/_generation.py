@@ -0,0 +1,25 @@
+# coding=utf-8
+"""
+Global generation of the configuration
+"""
+
+
+class ConfigGeneration:
+    """
+    Counter bumped every time the configuration may have changed
+
+    That is: when the config file is parsed again or invalidated, when the index of the OS environment is rebuilt, and
+    when elib_config is setup.
+    """
+    __slots__: list = []
+    value: int = 0
+    check_interval: float = 1.0
+    """Delay, in seconds, between two checks of the config file and of the OS environment for changes"""
+    next_check: float = 0.0
+
+    @classmethod
+    def bump(cls):
+        """
+        Marks all previously resolved values as outdated
+        """
+        cls.value += 1
@@ -5,7 +5,8 @@ elib_config package configuration
 import typing
 
 # noinspection PyProtectedMember
-from elib_config import IncompleteSetupError
+from elib_config._file._exc import IncompleteSetupError
+from elib_config._generation import ConfigGeneration
 
 
 class ELIBConfig:
@@ -18,6 +19,8 @@ class ELIBConfig:
     config_file_path: str = 'not_set'
     config_sep_str: str = 'not_set'
     root_path: typing.Optional[typing.List[str]] = None
+    generation: int = 0
+    """Bumped every time a setting that changes the paths of config values is modified"""
 
     @classmethod
     def check(cls):
@@ -55,8 +58,11 @@ class ELIBConfig:
         :param root_path: list of strings that will be pre-pended to *all* config values paths (useful to setup a
         prefix for the whole app)
         """
+        if (app_name, config_sep_str, root_path) != (cls.app_name, cls.config_sep_str, cls.root_path):
+            cls.generation += 1
         cls.app_version = app_version
         cls.app_name = app_name
         cls.config_file_path = config_file_path
         cls.config_sep_str = config_sep_str
         cls.root_path = root_path
+        ConfigGeneration.bump()
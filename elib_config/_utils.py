@@ -4,24 +4,16 @@ Utils for elib_config
 """
 import typing
 
-import tomlkit.container
-import tomlkit.items
-
 from elib_config._logging import LOGGER
 from elib_config._types import Types
 
 _TRANSLATE_TYPE = {
     bool: Types.boolean,
     str: Types.string,
-    tomlkit.items.String: Types.string,
     int: Types.integer,
-    tomlkit.items.Integer: Types.integer,
     float: Types.float,
-    tomlkit.items.Float: Types.float,
     list: Types.array,
     dict: Types.table,
-    tomlkit.container.Container: Types.table,
-
 }
 
 
@@ -29,11 +21,15 @@ def friendly_type_name(raw_type: typing.Type) -> str:
     """
     Returns a user-friendly type name
 
+    Subclasses of the managed types (for example, tomlkit items) are translated as their base type.
+
     :param raw_type: raw type (str, int, ...)
     :return: user friendly type as string
     """
-    try:
-        return _TRANSLATE_TYPE[raw_type]
-    except KeyError:
-        LOGGER.error('unmanaged value type: %s', raw_type)
-        return str(raw_type)
+    for base_type in getattr(raw_type, '__mro__', (raw_type,)):
+        try:
+            return _TRANSLATE_TYPE[base_type]
+        except KeyError:
+            continue
+    LOGGER.error('unmanaged value type: %s', raw_type)
+    return str(raw_type)
@@ -1,35 +1,107 @@
 # coding=utf-8
 """
 Verifies that all configuration values have a valid setting
+
+All values are resolved in a single pass, against one snapshot of the config file and of the OS environment. Values
+that involve filesystem checks (paths) are resolved concurrently, in a bounded thread pool.
 """
+import typing
 
+# noinspection PyProtectedMember
+from elib_config._environ import environ_snapshot
+from elib_config._exc import ELIBConfigError
+# noinspection PyProtectedMember
+from elib_config._file._config_file import read_config_file
 from elib_config._setup import ELIBConfig
 # noinspection PyProtectedMember
 from elib_config._value._config_value import ConfigValue
 # noinspection PyProtectedMember
 from elib_config._value._exc import DuplicateConfigValueError, MissingValueError
 
+_MAX_FILESYSTEM_WORKERS = 16
+
+_Document = typing.Mapping[str, typing.Any]
+_Environ = typing.Mapping[str, str]
+
+
+def _resolve(config_value: ConfigValue, document: _Document, environ: _Environ) -> typing.Optional[ELIBConfigError]:
+    try:
+        # noinspection PyProtectedMember
+        config_value._resolve(document, environ)  # pylint: disable=protected-access
+    except ELIBConfigError as error:
+        return error
+    return None
+
+
+def _resolve_concurrently(config_values: typing.List[ConfigValue], document: _Document, environ: _Environ
+                          ) -> typing.Dict[ConfigValue, typing.Optional[ELIBConfigError]]:
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(_MAX_FILESYSTEM_WORKERS, len(config_values))) as executor:
+        results = executor.map(lambda config_value: _resolve(config_value, document, environ), config_values)
+        return dict(zip(config_values, results))
+
+
+def _check_config_values() -> typing.List[typing.Tuple[ConfigValue, ELIBConfigError]]:
+    ELIBConfig.check()
+    document = read_config_file()
+    environ = environ_snapshot()
+    config_values = list(ConfigValue.config_values)
+    filesystem_values = [
+        # noinspection PyProtectedMember
+        value for value in config_values if value._checks_filesystem  # pylint: disable=protected-access
+    ]
+    resolved: typing.Dict[ConfigValue, typing.Optional[ELIBConfigError]] = {}
+    if len(filesystem_values) > 1:
+        resolved = _resolve_concurrently(filesystem_values, document, environ)
+    errors: typing.List[typing.Tuple[ConfigValue, ELIBConfigError]] = []
+    for config_value in config_values:
+        if ConfigValue.config_values.is_duplicate(config_value):
+            errors.append((config_value, DuplicateConfigValueError(config_value.name)))
+        if config_value in resolved:
+            error = resolved[config_value]
+        else:
+            error = _resolve(config_value, document, environ)
+        if error is not None:
+            errors.append((config_value, error))
+    return errors
 
-def validate_config(raise_=True):
+
+def collect_config_errors() -> typing.List[ELIBConfigError]:
+    """
+    Checks all configuration values, without raising
+
+    :return: every error found (duplicates, missing values, wrong types, values out of bounds, ...), in the order
+        the values have been declared
+    """
+    return [error for _, error in _check_config_values()]
+
+
+def validate_config(raise_=True) -> typing.Tuple[typing.Set[str], typing.Set[str]]:
     """
     Verifies that all configuration values have a valid setting
+
+    Duplicate values are reported first, then missing values, then any other error (the first one found is raised).
+    Use :py:func:`collect_config_errors` to get all of them at once.
+
+    :param raise_: raise an exception if the configuration is not valid
+    :return: names of the duplicate values and names of the missing values; other errors (wrong types, values out of
+        bounds, ...) are only raised, use :py:func:`collect_config_errors` to get them without raising
     """
-    ELIBConfig.check()
-    known_paths = set()
     duplicate_values = set()
     missing_values = set()
-    for config_value in ConfigValue.config_values:
-        if config_value.path not in known_paths:
-            known_paths.add(config_value.path)
-        else:
+    other_errors = []
+    for config_value, error in _check_config_values():
+        if isinstance(error, DuplicateConfigValueError):
             duplicate_values.add(config_value.name)
-        try:
-            config_value()
-        except MissingValueError:
+        elif isinstance(error, MissingValueError):
             missing_values.add(config_value.name)
+        else:
+            other_errors.append(error)
 
     if raise_ and duplicate_values:
         raise DuplicateConfigValueError(str(duplicate_values))
     if raise_ and missing_values:
         raise MissingValueError(str(missing_values), 'missing config value(s)')
+    if raise_ and other_errors:
+        raise other_errors[0]
     return duplicate_values, missing_values
@@ -8,41 +8,115 @@ be returned, or an exception will be raised.
 Config value have strong type that will be checked and enforced at runtime.
 
 They also have a description, which will be used to create the example config file.
+
+Resolved values can optionally be cached (see :py:meth:`ConfigValue.set_cache_policy`).
+
+Values can be changed in the config file with :py:meth:`ConfigValue.set`; use :py:func:`elib_config.transaction` to
+change several values with a single write.
 """
 import abc
-import os
+import time
 import typing
 
+from elib_config._environ import check_environ, getenv
 # noinspection PyProtectedMember
 from elib_config._file._config_file import read_config_file
+# noinspection PyProtectedMember
+from elib_config._file._transaction import transaction
+from elib_config._generation import ConfigGeneration
 from elib_config._setup import ELIBConfig
 from elib_config._utils import friendly_type_name
 from elib_config._value._config_value_toml import ConfigValueTOML, SENTINEL
 from ._exc import ConfigValueTypeError, MissingValueError
+from ._registry import ConfigValueRegistry
+
+
+class CachePolicy:
+    """
+    Simple enum for the caching policies of resolved config values
+
+    A number of seconds can also be used as a policy, in which case resolved values expire after that delay.
+    """
+    never = 'never'
+    forever = 'forever'
+    generation = 'generation'
+
+
+_TTL = 'ttl'
+
+
+def _check_for_changes():
+    """
+    Looks for changes of the config file and of the OS environment, at most once every
+    :py:attr:`ConfigGeneration.check_interval` seconds; changes bump the generation
+    """
+    now = time.monotonic()
+    if now < ConfigGeneration.next_check:
+        return
+    ConfigGeneration.next_check = now + ConfigGeneration.check_interval
+    read_config_file()
+    check_environ()
 
 
 class ConfigValue(ConfigValueTOML, abc.ABC):
     """
     Abstract base class for config values
     """
-    config_values: typing.List['ConfigValue'] = []
+    __slots__ = (
+        '_cache_policy', '_cache_ttl', '_cached_value', '_cached_generation', '_cached_until',
+        '_raw_path', '_default', '_description', '_example_fragment', '_example_fingerprint_cache',
+        '_paths_generation', '_path', '_name', '_var_name', '_path_keys', '_memoized_raw_value', '_memoized_value',
+    )
+    config_values: ConfigValueRegistry = ConfigValueRegistry()
 
     def __init__(self, *path: str, description: str, default=SENTINEL) -> None:
+        self._cache_policy: str = CachePolicy.never
+        self._cache_ttl: float = 0.0
+        self._cached_value: typing.Any = SENTINEL
+        self._cached_generation: int = -1
+        self._cached_until: float = 0.0
+        self._memoized_raw_value: typing.Any = SENTINEL
+        self._memoized_value: typing.Any = None
+        self._example_fragment: typing.Optional[str] = None
+        self._example_fingerprint_cache: typing.Optional[str] = None
         self._raw_path = path
         self.default: typing.Any = default
-        self.description: str = description
-        ConfigValue.config_values.append(self)
+        self.description = description
+        self._paths_generation: int = -1
+        self._path: str = ''
+        self._name: str = ''
+        self._var_name: str = ''
+        self._path_keys: typing.Tuple[str, ...] = ()
+        ConfigValue.config_values.register(self)
+
+    def _update_paths(self):
+        path: str = ELIBConfig.config_sep_str.join(self._raw_path)
+        if ELIBConfig.root_path:
+            prefix = ELIBConfig.config_sep_str.join(ELIBConfig.root_path)
+            path = ELIBConfig.config_sep_str.join((prefix, path))
+        self._path = path
+        self._path_keys = tuple(path.split(ELIBConfig.config_sep_str))
+        self._name = path.replace('__', '.')
+        self._var_name = ELIBConfig.config_sep_str.join((ELIBConfig.app_name, path)).upper()
+        self._paths_generation = ELIBConfig.generation
 
     @property
     def path(self) -> str:
         """
         :return: path of this config value as a string
         """
-        path: str = ELIBConfig.config_sep_str.join(self._raw_path)
-        if ELIBConfig.root_path:
-            prefix = ELIBConfig.config_sep_str.join(ELIBConfig.root_path)
-            path = ELIBConfig.config_sep_str.join((prefix, path))
-        return path
+        if self._paths_generation != ELIBConfig.generation:
+            self._update_paths()
+        return self._path
+
+    @property
+    def path_keys(self) -> typing.Tuple[str, ...]:
+        """
+        :return: components of the path of this config value
+        """
+        if self._paths_generation != ELIBConfig.generation:
+            self._update_paths()
+        return self._path_keys
 
     @property
     def key(self) -> str:
@@ -57,18 +131,30 @@ class ConfigValue(ConfigValueTOML, abc.ABC):
         """
         :return: user friendly name of this value as a string
         """
-        return self.path.replace('__', '.')
+        if self._paths_generation != ELIBConfig.generation:
+            self._update_paths()
+        return self._name
 
-    def _from_environ(self) -> typing.Optional[object]:
-        var_name = ELIBConfig.config_sep_str.join((ELIBConfig.app_name, self.path)).upper()
-        for env_var in os.environ:
-            if env_var.upper() == var_name:
-                return os.getenv(env_var)
-        return None
+    @property
+    def var_name(self) -> str:
+        """
+        :return: name of the OS environment variable for this value (upper case)
+        """
+        if self._paths_generation != ELIBConfig.generation:
+            self._update_paths()
+        return self._var_name
+
+    def _from_environ(self, environ: typing.Optional[typing.Mapping[str, str]] = None) -> typing.Optional[object]:
+        if environ is None:
+            return getenv(self.var_name)
+        return environ.get(self.var_name)
 
-    def _from_config_file(self) -> typing.Optional[object]:
-        value = read_config_file()
-        for key in self.path.split(ELIBConfig.config_sep_str):
+    def _from_config_file(self, document: typing.Optional[typing.Mapping[str, typing.Any]] = None
+                          ) -> typing.Optional[object]:
+        if self._paths_generation != ELIBConfig.generation:
+            self._update_paths()
+        value = read_config_file() if document is None else document
+        for key in self._path_keys:
             try:
                 value = value[key]
             except KeyError:
@@ -76,37 +162,169 @@ class ConfigValue(ConfigValueTOML, abc.ABC):
 
         return value
 
+    @property
+    def default(self) -> typing.Any:
+        """
+        :return: default value
+        """
+        return self._default
+
+    @default.setter
+    def default(self, value: typing.Any):
+        self._default = value
+        self.clear_cache()
+
+    @property
+    def description(self) -> str:
+        """
+        :return: description of this value, used in the example config file
+        """
+        return self._description
+
+    @description.setter
+    def description(self, value: str):
+        self._description = value
+        self.clear_cache()
+
+    def set_cache_policy(self, policy: typing.Union[str, float]):
+        """
+        Sets the caching policy of the resolved value
+
+        - :py:attr:`CachePolicy.never` (default): the value is resolved every time it is called
+        - :py:attr:`CachePolicy.forever`: the value is resolved once
+        - :py:attr:`CachePolicy.generation`: the value is resolved again once the configuration has changed (config
+          file or OS environment changed, :py:func:`elib_config.invalidate` or :py:func:`elib_config.refresh_environ`
+          called, or new setup). Changes of the config file and of the OS environment are noticed within
+          :py:attr:`ConfigGeneration.check_interval` seconds (one second by default).
+        - a number of seconds: the value is resolved again after that delay
+
+        :param policy: one of :py:class:`CachePolicy`, or a number of seconds
+        """
+        if isinstance(policy, str):
+            if policy not in (CachePolicy.never, CachePolicy.forever, CachePolicy.generation):
+                raise ValueError(f'{self.name}: unknown cache policy: {policy}')
+            self._cache_policy, self._cache_ttl = policy, 0.0
+        else:
+            if policy <= 0:
+                raise ValueError(f'{self.name}: cache TTL must be a positive number of seconds, got: {policy}')
+            self._cache_policy, self._cache_ttl = _TTL, float(policy)
+        self.clear_cache()
+
+    def clear_cache(self):
+        """
+        Drops the cached resolved value and the cached example of this value, if any
+
+        Setters of the description, the default and the constraints of a value call this method.
+        """
+        self._cached_value = SENTINEL
+        self._memoized_raw_value = SENTINEL
+        self._example_fragment = None
+        self._example_fingerprint_cache = None
+
     def _from_default(self) -> typing.Optional[object]:
         if self.default != SENTINEL:
             return self.default
 
         return None
 
-    def raw_value(self) -> typing.Optional[object]:
+    def raw_value(self,
+                  document: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+                  environ: typing.Optional[typing.Mapping[str, str]] = None,
+                  ) -> typing.Optional[object]:
         """
+        :param document: parsed config file to use instead of reading it
+        :param environ: snapshot of the OS environment (with upper-cased names) to use instead of the actual one
         :return: raw value
         """
-        raw_value = self._from_environ()
+        raw_value = self._from_environ(environ)
         if raw_value is None:
-            raw_value = self._from_config_file()
+            raw_value = self._from_config_file(document)
         if raw_value is None:
             raw_value = self._from_default()
         return raw_value
 
-    def __call__(self):
-        raw_value = self.raw_value()
+    def _cache_hit(self) -> bool:
+        if self._cached_value is SENTINEL:
+            return False
+        if self._cache_policy == CachePolicy.generation:
+            _check_for_changes()
+            return self._cached_generation == ConfigGeneration.value
+        if self._cache_policy == CachePolicy.forever:
+            return True
+        return time.monotonic() < self._cached_until
+
+    def _resolve(self,
+                 document: typing.Optional[typing.Mapping[str, typing.Any]] = None,
+                 environ: typing.Optional[typing.Mapping[str, str]] = None,
+                 ):
+        raw_value = self.raw_value(document, environ)
         if raw_value is None:
             raise MissingValueError(self.path, 'missing config value')
         return self._cast(raw_value)
 
-    def _raise_invalid_type_error(self):
-        _raw_value_type = type(self.raw_value())
+    def __call__(self):
+        if self._cache_policy == CachePolicy.never:
+            return self._resolve()
+        if self._cache_hit():
+            return self._cached_value
+        value = self._resolve()
+        self._cached_value = value
+        self._cached_generation = ConfigGeneration.value
+        self._cached_until = time.monotonic() + self._cache_ttl
+        return value
+
+    def set(self, value: typing.Any):
+        """
+        Sets this value in the config file
+
+        The value is checked before anything is written. Outside of a transaction (see
+        :py:func:`elib_config.transaction`), the config file is written immediately.
+
+        Note that a value set in the OS environment still takes precedence over the config file.
+
+        :param value: new value, as it would be read from the config file
+        """
+        try:
+            self._cast(value)
+        finally:
+            # checking the value memoized it (and whatever is derived from it), although it is not written yet
+            self.clear_cache()
+        with transaction() as current:
+            current.set(self, self._to_toml(value))
+
+    @property
+    def _checks_filesystem(self) -> bool:
+        """
+        :return: True if resolving this value involves (potentially slow) filesystem checks
+        """
+        return False
+
+    def _raise_invalid_type_error(self, raw_value):
+        _raw_value_type = type(raw_value)
         actual_type: str = friendly_type_name(_raw_value_type)
         raise ConfigValueTypeError(
             self.path,
             f'config value must be of type "{self.type_name}", got "{actual_type}" instead.'
         )
 
+    def _cast_memoized(self, raw_value, builder: typing.Callable[[typing.Any], typing.Any]) -> typing.Any:
+        """
+        Casts a raw value with a costly builder, unless that same raw value has just been cast
+
+        The parsed config file is cached until it changes, so the identity of the raw value tells whether it has
+        already been cast. The result is shared between calls, so the builder must return an immutable value (or
+        callers must copy it).
+
+        :param raw_value: raw value to cast
+        :param builder: function that checks the raw value and returns the cast value
+        :return: cast value
+        """
+        if raw_value is self._memoized_raw_value:
+            return self._memoized_value
+        value = builder(raw_value)
+        self._memoized_raw_value, self._memoized_value = raw_value, value
+        return value
+
     @abc.abstractmethod
     def _cast(self, raw_value):
         pass
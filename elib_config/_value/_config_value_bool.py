@@ -2,7 +2,7 @@
 """
 Config value that will be cast as a boolean
 """
-import tomlkit.container
+import typing
 
 from elib_config._types import Types
 from ._config_value import ConfigValue
@@ -13,6 +13,7 @@ class ConfigValueBool(ConfigValue):
     """
     Config value that will be cast as a boolean
     """
+    __slots__ = ()
 
     @property
     def type_name(self) -> str:
@@ -34,7 +35,7 @@ class ConfigValueBool(ConfigValue):
     def __call__(self) -> bool:
         return super(ConfigValueBool, self).__call__()
 
-    def _toml_add_examples(self, toml_obj: tomlkit.container.Container):
-        self._toml_comment(toml_obj, '"true" and "false" are the only valid boolean values')
-        self._toml_comment(toml_obj, 'example = true')
-        self._toml_comment(toml_obj, 'example = false')
+    def _toml_add_examples(self, lines: typing.List[str]):
+        self._toml_comment(lines, '"true" and "false" are the only valid boolean values')
+        self._toml_comment(lines, 'example = true')
+        self._toml_comment(lines, 'example = false')
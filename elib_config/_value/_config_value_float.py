@@ -4,8 +4,6 @@ Config value that will be cast as a string
 """
 import typing
 
-import tomlkit.container
-
 from elib_config._types import Types
 from ._config_value_integer import ConfigValueInteger
 
@@ -14,6 +12,7 @@ class ConfigValueFloat(ConfigValueInteger):
     """
     Config value that will be cast as a string
     """
+    __slots__ = ()
 
     @property
     def type_name(self) -> str:
@@ -24,7 +23,7 @@ class ConfigValueFloat(ConfigValueInteger):
 
     def _cast(self, raw_value) -> float:
         if not isinstance(raw_value, float):
-            return self._raise_invalid_type_error()
+            return self._raise_invalid_type_error(raw_value)
         value = float(raw_value)
         if (self._min and value < self._min) or (self._max and value > self._max):
             return self._raise_out_of_bound_error(value)
@@ -44,8 +43,9 @@ class ConfigValueFloat(ConfigValueInteger):
         :param max_: maxima
         """
         self._min, self._max = min_, max_
+        self.clear_cache()
 
-    def _toml_add_examples(self, toml_obj: tomlkit.container.Container):
-        self._toml_comment(toml_obj, 'example = 132.5')
-        self._toml_comment(toml_obj, 'example = 0.0')
-        self._toml_comment(toml_obj, 'example = -20.765')
+    def _toml_add_examples(self, lines: typing.List[str]):
+        self._toml_comment(lines, 'example = 132.5')
+        self._toml_comment(lines, 'example = 0.0')
+        self._toml_comment(lines, 'example = -20.765')
@@ -4,8 +4,6 @@ Config value that will be cast as a string
 """
 import typing
 
-import tomlkit.container
-
 from elib_config._types import Types
 from ._config_value import ConfigValue, SENTINEL
 from ._exc import OutOfBoundError
@@ -15,6 +13,7 @@ class ConfigValueInteger(ConfigValue):
     """
     Config value that will be cast as a string
     """
+    __slots__ = ('_min', '_max')
 
     def __init__(self, *path: str, description: str, default=SENTINEL) -> None:
         super(ConfigValueInteger, self).__init__(*path, description=description, default=default)
@@ -33,7 +32,7 @@ class ConfigValueInteger(ConfigValue):
 
     def _cast(self, raw_value) -> float:
         if not isinstance(raw_value, int) or isinstance(raw_value, bool):
-            return self._raise_invalid_type_error()
+            return self._raise_invalid_type_error(raw_value)
         value = int(raw_value)
         if (self._min and value < self._min) or (self._max and value > self._max):
             return self._raise_out_of_bound_error(value)
@@ -53,8 +52,9 @@ class ConfigValueInteger(ConfigValue):
         :param max_: maxima
         """
         self._min, self._max = min_, max_
+        self.clear_cache()
 
-    def _toml_add_examples(self, toml_obj: tomlkit.container.Container):
-        self._toml_comment(toml_obj, 'example = 10')
-        self._toml_comment(toml_obj, 'example = 0')
-        self._toml_comment(toml_obj, 'example = -5')
+    def _toml_add_examples(self, lines: typing.List[str]):
+        self._toml_comment(lines, 'example = 10')
+        self._toml_comment(lines, 'example = 0')
+        self._toml_comment(lines, 'example = -5')
@@ -2,15 +2,18 @@
 """
 Config value that will be cast as a list
 """
-
+import array
 import typing
 
-import tomlkit.container
-
 from elib_config._types import Types
 from elib_config._utils import friendly_type_name
 from ._config_value import ConfigValue, SENTINEL
-from ._exc import ConfigValueTypeError
+from ._exc import ConfigValueError, ConfigValueTypeError, OutOfBoundError
+
+_COMPACT_TYPE_CODES = {
+    int: 'q',
+    float: 'd',
+}
 
 
 class ConfigValueList(ConfigValue):
@@ -18,7 +21,11 @@ class ConfigValueList(ConfigValue):
     Config value that will be cast as a list
 
     Additionally, all element of the list will be type-checked
+
+    Lists of integers or floats can be declared "compact": they are then returned as a read-only memoryview over an
+    array.array, which is validated in bulk and cached until the config changes.
     """
+    __slots__ = ('element_type', '_compact', '_min', '_max')
 
     @property
     def type_name(self) -> str:
@@ -34,17 +41,40 @@ class ConfigValueList(ConfigValue):
         """
         return f'{Types.array} of {self._expected_element_type}s'
 
-    def __init__(self, *path: str, element_type: typing.Type, description: str, default: typing.Any = SENTINEL) -> None:
+    def __init__(self,
+                 *path: str,
+                 element_type: typing.Type,
+                 description: str,
+                 default: typing.Any = SENTINEL,
+                 compact: bool = False,
+                 ) -> None:
+        if compact and element_type not in _COMPACT_TYPE_CODES:
+            raise ValueError(f'compact lists must contain integers or floats, not: {friendly_type_name(element_type)}')
         self.element_type = element_type
+        self._compact = compact
+        self._min: typing.Optional[float] = None
+        self._max: typing.Optional[float] = None
         super(ConfigValueList, self).__init__(*path, description=description, default=default)
 
+    def set_limits(self, min_=None, max_=None):
+        """
+        Sets limits for the elements of this list (integers or floats only)
+
+        If any element is outside those limits, an exception will be raised
+
+        :param min_: minima
+        :param max_: maxima
+        """
+        if self.element_type not in _COMPACT_TYPE_CODES:
+            raise ValueError(f'{self.name}: limits only apply to lists of integers or floats')
+        self._min, self._max = min_, max_
+        self.clear_cache()
+
     @property
     def _expected_element_type(self) -> str:
         return friendly_type_name(self.element_type)
 
-    def _cast(self, raw_value: object) -> list:
-        if not isinstance(raw_value, list):
-            return self._raise_invalid_type_error()
+    def _check_items(self, raw_value: list):
         for index, item in enumerate(raw_value):
             if not isinstance(item, self.element_type):
                 actual_type = friendly_type_name(type(item))
@@ -53,22 +83,60 @@ class ConfigValueList(ConfigValue):
                     f'{self.name}: item at index {index} should be a "{self._expected_element_type}", but is '
                     f'"{actual_type}" instead'
                 )
+
+    def _check_limits(self, lowest, highest):
+        if self._min is not None and lowest < self._min:
+            raise OutOfBoundError(self.name, lowest, self._min, self._max)
+        if self._max is not None and highest > self._max:
+            raise OutOfBoundError(self.name, highest, self._min, self._max)
+
+    def _build_compact(self, raw_value: list) -> memoryview:
+        type_code = _COMPACT_TYPE_CODES[self.element_type]
+        # array.array only accepts integers for the 'q' type code, so building it is enough of a type check for lists
+        # of integers; it would silently convert integers to floats though, so the (few) distinct types of the
+        # elements are checked for lists of floats
+        if type_code == 'd' and not all(issubclass(item_type, float) for item_type in set(map(type, raw_value))):
+            self._check_items(raw_value)
+        try:
+            compact_value = array.array(type_code, raw_value)
+        except TypeError:
+            self._check_items(raw_value)
+            raise
+        except OverflowError as error:
+            raise ConfigValueError(self.name, f'value does not fit in a compact list: {error}')
+        if raw_value and (self._min is not None or self._max is not None):
+            # min() and max() are faster on the list, as the array would have to box every element again
+            self._check_limits(min(raw_value), max(raw_value))
+        # a view over bytes is read-only, so it can safely be shared between calls
+        return memoryview(compact_value.tobytes()).cast(type_code)
+
+    def _cast(self, raw_value: object) -> typing.Union[list, memoryview]:
+        if not isinstance(raw_value, list):
+            return self._raise_invalid_type_error(raw_value)
+        if self._compact:
+            return self._cast_memoized(raw_value, self._build_compact)
+        self._check_items(raw_value)
+        if raw_value and (self._min is not None or self._max is not None):
+            self._check_limits(min(raw_value), max(raw_value))
         return raw_value
 
-    # pylint: disable=useless-super-delegation
-    def __call__(self) -> list:
-        return super(ConfigValueList, self).__call__()
+    def __call__(self) -> typing.Union[list, memoryview]:
+        value = super(ConfigValueList, self).__call__()
+        if isinstance(value, list):
+            # the list comes from the parsed config file (or the default), which is shared between callers
+            return list(value)
+        return value
 
-    def _toml_add_value_type(self, toml_obj: tomlkit.container.Container):
-        super(ConfigValueList, self)._toml_add_value_type(toml_obj)
-        self._toml_comment(toml_obj, f'Array elements must be type: {self._expected_element_type}')
+    def _toml_add_value_type(self, lines: typing.List[str]):
+        super(ConfigValueList, self)._toml_add_value_type(lines)
+        self._toml_comment(lines, f'Array elements must be type: {self._expected_element_type}')
 
-    def _toml_add_examples(self, toml_obj: tomlkit.container.Container):
+    def _toml_add_examples(self, lines: typing.List[str]):
         if self.element_type == str:
-            self._toml_comment(toml_obj, 'example = ["a", "b", "c", "d e"] # A list of strings')
+            self._toml_comment(lines, 'example = ["a", "b", "c", "d e"] # A list of strings')
         elif self.element_type == int:
-            self._toml_comment(toml_obj, 'example = [1, 2, 3, 4, 5] # A list of integers')
+            self._toml_comment(lines, 'example = [1, 2, 3, 4, 5] # A list of integers')
         elif self.element_type == float:
-            self._toml_comment(toml_obj, 'example = [1.0, 2.0, 3.0] # A list of floats')
+            self._toml_comment(lines, 'example = [1.0, 2.0, 3.0] # A list of floats')
         else:
             raise KeyError(f'unmanaged element type: {self.element_type}')
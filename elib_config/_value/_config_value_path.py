@@ -4,11 +4,12 @@ Config value that will be cast as a `pathlib.Path`
 
 Provides a few helpers to further customize the behaviour for path config values
 """
+import os
+import stat
+import time
 import typing
 from pathlib import Path
 
-import tomlkit.container
-
 from elib_config._types import Types
 from ._config_value import ConfigValue, SENTINEL
 from ._exc import NotAFileError, NotAFolderError, PathMustExistError
@@ -17,7 +18,11 @@ from ._exc import NotAFileError, NotAFolderError, PathMustExistError
 class ConfigValuePath(ConfigValue):
     """
     Config value that will be cast as a `pathlib.Path`
+
+    All constraints are checked against a single `os.stat` call, the result of which can optionally be cached (see
+    :py:meth:`set_stat_cache_ttl`).
     """
+    __slots__ = ('_must_be_file', '_must_be_dir', '_create_dir', '_must_exist', '_stat_ttl', '_stat_cache')
 
     def __init__(self,
                  *path: str,
@@ -29,12 +34,15 @@ class ConfigValuePath(ConfigValue):
         self._must_be_dir: bool = False
         self._create_dir: bool = False
         self._must_exist: bool = False
+        self._stat_ttl: float = 0.0
+        self._stat_cache: typing.Optional[typing.Tuple[Path, float, typing.Optional[os.stat_result]]] = None
 
     def must_exist(self):
         """
         Indicates this path must exist before runtime
         """
         self._must_exist = True
+        self.clear_cache()
 
     def must_be_file(self):
         """
@@ -43,6 +51,7 @@ class ConfigValuePath(ConfigValue):
         if self._must_be_dir:
             raise AttributeError('path config value cannot be both a file and a directory')
         self._must_be_file = True
+        self.clear_cache()
 
     def must_be_dir(self):
         """
@@ -51,12 +60,52 @@ class ConfigValuePath(ConfigValue):
         if self._must_be_file:
             raise AttributeError('path config value cannot be both a file and a directory')
         self._must_be_dir = True
+        self.clear_cache()
 
     def create_dir(self):
         """
         Indicates that, if it doesn't exist already, this path will be created as a directory
         """
         self._create_dir = True
+        self.clear_cache()
+
+    def set_stat_cache_ttl(self, ttl: float):
+        """
+        Caches the result of the filesystem checks for the given delay
+
+        :param ttl: number of seconds to cache the status of the path for (0 disables the cache, the default)
+        """
+        if ttl < 0:
+            raise ValueError(f'{self.name}: stat cache TTL must be a positive number of seconds, got: {ttl}')
+        self._stat_ttl = float(ttl)
+        self._stat_cache = None
+
+    def refresh(self) -> Path:
+        """
+        Drops all cached state (filesystem status and resolved value), and resolves this value again
+
+        :return: value of this path
+        """
+        self._stat_cache = None
+        self.clear_cache()
+        return self()
+
+    @property
+    def _checks_filesystem(self) -> bool:
+        return self._must_exist or self._must_be_dir or self._must_be_file or self._create_dir
+
+    def _stat(self, path: Path) -> typing.Optional[os.stat_result]:
+        if self._stat_ttl:
+            cached = self._stat_cache
+            if cached is not None and cached[0] == path and time.monotonic() < cached[1]:
+                return cached[2]
+        try:
+            stat_result: typing.Optional[os.stat_result] = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError, ValueError):
+            stat_result = None
+        if self._stat_ttl:
+            self._stat_cache = (path, time.monotonic() + self._stat_ttl, stat_result)
+        return stat_result
 
     @property
     def type_name(self) -> str:
@@ -85,25 +134,36 @@ class ConfigValuePath(ConfigValue):
         try:
             path = Path(raw_value)
         except TypeError:
-            return self._raise_invalid_type_error()
+            return self._raise_invalid_type_error(raw_value)
         else:
-            if self._must_exist and not path.exists():
-                raise PathMustExistError(self.path)
-            if path.exists() and self._must_be_dir and not path.is_dir():
-                raise NotAFolderError(self.path)
-            if path.exists() and self._must_be_file and not path.is_file():
-                raise NotAFileError(self.path)
-            if not path.exists() and self._create_dir:
-                path.mkdir(parents=True)
+            if not self._checks_filesystem:
+                # nothing to check, no need to touch the filesystem
+                return path.absolute()
+            stat_result = self._stat(path)
+            if stat_result is None:
+                if self._must_exist:
+                    raise PathMustExistError(self.path)
+                if self._create_dir:
+                    # another value might be creating the same directory concurrently (see validate_config)
+                    path.mkdir(parents=True, exist_ok=True)
+                    self._stat_cache = None
+            else:
+                if self._must_be_dir and not stat.S_ISDIR(stat_result.st_mode):
+                    raise NotAFolderError(self.path)
+                if self._must_be_file and not stat.S_ISREG(stat_result.st_mode):
+                    raise NotAFileError(self.path)
             return path.absolute()
 
+    def _to_toml(self, value: typing.Any) -> typing.Any:
+        return str(value) if isinstance(value, os.PathLike) else value
+
     # pylint: disable=useless-super-delegation
     def __call__(self) -> Path:
         return super(ConfigValuePath, self).__call__()
 
-    def _toml_add_examples(self, toml_obj: tomlkit.container.Container):
-        self._toml_comment(toml_obj, r'WARNING: backslash characters ("\") must be doubled.')
-        self._toml_comment(toml_obj, 'Alternatively, you can use the forward slash: "/" (even on Windows).')
-        self._toml_comment(toml_obj, r'example = c:\\some\\folder')
-        self._toml_comment(toml_obj, r'example = c:\\some\\folder\\file.ext')
-        self._toml_comment(toml_obj, r'example = c:/this/is/valid/too')
+    def _toml_add_examples(self, lines: typing.List[str]):
+        self._toml_comment(lines, r'WARNING: backslash characters ("\") must be doubled.')
+        self._toml_comment(lines, 'Alternatively, you can use the forward slash: "/" (even on Windows).')
+        self._toml_comment(lines, r'example = c:\\some\\folder')
+        self._toml_comment(lines, r'example = c:\\some\\folder\\file.ext')
+        self._toml_comment(lines, r'example = c:/this/is/valid/too')
@@ -0,0 +1,39 @@
+# coding=utf-8
+"""
+Config value that will be cast as a frozenset
+"""
+import typing
+
+from ._config_value import SENTINEL
+from ._config_value_list import ConfigValueList
+
+
+class ConfigValueSet(ConfigValueList):
+    """
+    Config value that will be cast as a frozenset
+
+    It is written as an array in the config file, exactly like :py:class:`ConfigValueList`; duplicate elements are
+    ignored. The frozenset is cached until the config changes, so membership tests are cheap even on hot paths.
+
+    Sets can be used as default values, and with :py:meth:`set`; they are written as sorted arrays.
+    """
+    __slots__ = ()
+
+    def __init__(self, *path: str, element_type: typing.Type, description: str, default: typing.Any = SENTINEL) -> None:
+        super(ConfigValueSet, self).__init__(*path, element_type=element_type, description=description, default=default)
+
+    def _build_frozenset(self, raw_value: object) -> typing.FrozenSet:
+        if isinstance(raw_value, (set, frozenset)):
+            super(ConfigValueSet, self)._cast(list(raw_value))
+            return frozenset(raw_value)
+        return frozenset(super(ConfigValueSet, self)._cast(raw_value))
+
+    def _cast(self, raw_value: object) -> typing.FrozenSet:
+        return self._cast_memoized(raw_value, self._build_frozenset)
+
+    def _to_toml(self, value: typing.Any) -> typing.Any:
+        return sorted(value) if isinstance(value, (set, frozenset)) else value
+
+    # pylint: disable=useless-super-delegation
+    def __call__(self) -> typing.FrozenSet:
+        return super(ConfigValueSet, self).__call__()
@@ -2,7 +2,7 @@
 """
 Config value that will be cast as a string
 """
-import tomlkit.container
+import typing
 
 from elib_config._types import Types
 from ._config_value import ConfigValue
@@ -12,6 +12,7 @@ class ConfigValueString(ConfigValue):
     """
     Config value that will be cast as a string
     """
+    __slots__ = ()
 
     @property
     def type_name(self) -> str:
@@ -22,12 +23,12 @@ class ConfigValueString(ConfigValue):
 
     def _cast(self, raw_value) -> str:
         if not isinstance(raw_value, str):
-            self._raise_invalid_type_error()
+            self._raise_invalid_type_error(raw_value)
         return raw_value
 
     # pylint: disable=useless-super-delegation
     def __call__(self) -> str:
         return super(ConfigValueString, self).__call__()
 
-    def _toml_add_examples(self, toml_obj: tomlkit.container.Container):
-        self._toml_comment(toml_obj, r'example = "some text inside double quotes"')
+    def _toml_add_examples(self, lines: typing.List[str]):
+        self._toml_comment(lines, r'example = "some text inside double quotes"')
@@ -2,14 +2,31 @@
 """
 Config value that will be cast as a string
 """
+import array
+import functools
+import types
 import typing
 
 import dataclasses
-import tomlkit.container
 
 from elib_config._utils import friendly_type_name
 from ._config_value import ConfigValue, SENTINEL
-from ._exc import MissingTableKeyError, TableKeyTypeError
+from ._exc import ConfigValueTypeError, DuplicateTableIndexError, MissingTableKeyError, TableKeyTypeError
+from ._table_array import TableArray, TableIndex
+from ._table_schema import TableValidator, compile_table_validator
+from ._toml_render import render_key, render_key_value
+
+_COLUMN_TYPE_CODES = {
+    bool: 'b',
+    int: 'q',
+    float: 'd',
+}
+
+_NUMPY_DTYPES = {
+    'b': 'bool',
+    'q': 'int64',
+    'd': 'float64',
+}
 
 _KEY_VALUE_EXAMPLES = {
     str: "some text",
@@ -19,6 +36,18 @@ _KEY_VALUE_EXAMPLES = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _numpy() -> typing.Any:
+    """
+    :return: the numpy module if it is installed, or None
+    """
+    try:
+        import numpy
+        return numpy
+    except ImportError:
+        return None
+
+
 @dataclasses.dataclass
 class ConfigValueTableKey:
     """
@@ -48,16 +77,69 @@ class ConfigValueTableKey:
 
 class ConfigValueTableArray(ConfigValue):
     """
-    Config value that will be cast as a string
+    Config value that will be cast as a table, or as an array of tables
+
+    A single table is returned as a dict. An array of tables is returned as a :py:class:`TableArray`, which validates
+    each table the first time it is accessed.
+
+    Keys listed in ``index_on`` are indexed: tables can be looked up by the value of such a key with
+    ``value.index('name')['some name']``, or ``value.by_name['some name']``. Two tables sharing the same value for an
+    index key is an error.
+
+    Keys of type int, float or bool can also be read as a column of values (see :py:meth:`column`).
     """
+    __slots__ = (
+        '_keys', '_keys_by_name', '_validate_table', '_index_on', '_tables', '_indexes', '_columns',
+    )
 
     def __init__(self,
                  *path: str,
                  description: str,
                  default=SENTINEL,
-                 keys: typing.Iterable[ConfigValueTableKey] = SENTINEL) -> None:
+                 keys: typing.Iterable[ConfigValueTableKey] = SENTINEL,
+                 index_on: typing.Iterable[str] = (),
+                 ) -> None:
+        self._tables: typing.Sequence[typing.Mapping[str, typing.Any]] = ()
+        self._indexes: typing.Dict[str, TableIndex] = {}
+        self._columns: typing.Dict[str, typing.Any] = {}
+        self._index_on: typing.Tuple[str, ...] = ()
         super(ConfigValueTableArray, self).__init__(*path, description=description, default=default)
-        self.keys = [] if keys is SENTINEL else keys
+        self.keys = () if keys is SENTINEL else keys
+        self.index_on = index_on
+
+    @property
+    def keys(self) -> typing.Tuple[ConfigValueTableKey, ...]:
+        """
+        :return: keys of the table (assign new keys to change them: the schema is compiled when they are set)
+        """
+        return self._keys
+
+    @keys.setter
+    def keys(self, value: typing.Iterable[ConfigValueTableKey]):
+        self._keys = tuple(value)
+        self._keys_by_name: typing.Dict[str, ConfigValueTableKey] = {key.key_name: key for key in self._keys}
+        self._validate_table: TableValidator = compile_table_validator(self._keys)
+        self._check_index_on(self._index_on)
+        self.clear_cache()
+
+    @property
+    def index_on(self) -> typing.Tuple[str, ...]:
+        """
+        :return: names of the indexed keys
+        """
+        return self._index_on
+
+    @index_on.setter
+    def index_on(self, value: typing.Iterable[str]):
+        index_on = tuple(value)
+        self._check_index_on(index_on)
+        self._index_on = index_on
+        self.clear_cache()
+
+    def _check_index_on(self, index_on: typing.Tuple[str, ...]):
+        for key_name in index_on:
+            if key_name not in self._keys_by_name:
+                raise ValueError(f'{self.name}: cannot index on an undeclared key: {key_name}')
 
     @property
     def type_name(self) -> str:
@@ -66,49 +148,161 @@ class ConfigValueTableArray(ConfigValue):
         """
         return 'array of tables'
 
-    def _check_key_type(self, key, key_value):
+    @staticmethod
+    def _check_key_type(key, key_value, value_name: str):
         if not isinstance(key_value, key.key_type):
-            raise TableKeyTypeError(self.name,
+            raise TableKeyTypeError(value_name,
                                     key.key_name,
                                     friendly_type_name(key.key_type),
                                     friendly_type_name(type(key_value)),
                                     )
 
-    def _get_key_value(self, raw_value: dict, key: ConfigValueTableKey):
+    @staticmethod
+    def _get_key_value(raw_value: dict, key: ConfigValueTableKey, value_name: str):
         if key.key_name not in raw_value:
             if key.mandatory:
-                raise MissingTableKeyError(self.name, str(key))
+                raise MissingTableKeyError(value_name, str(key))
             else:
-                raw_value[key.key_name] = key.default
                 return key.default
 
         return raw_value[key.key_name]
 
-    def _check_keys(self, raw_value: dict) -> dict:
-        for key in self.keys:
-            key_value = self._get_key_value(raw_value, key)
-            self._check_key_type(key, key_value)
-        return raw_value
+    @staticmethod
+    def _check_table_type(raw_table, value_name: str):
+        if not isinstance(raw_table, dict):
+            actual_type = friendly_type_name(type(raw_table))
+            raise ConfigValueTypeError(value_name, f'expected a table, got "{actual_type}" instead.')
+
+    def _check_table(self, raw_table, index: int) -> dict:
+        value_name = f'{self.name}[{index}]'
+        self._check_table_type(raw_table, value_name)
+        return self._validate_table(raw_table, value_name)
+
+    def _build_index(self, raw_tables: list, tables: typing.Sequence[dict], key_name: str) -> TableIndex:
+        # only the index key is checked here, the rest of each table is still validated lazily
+        key = self._keys_by_name[key_name]
+        positions: typing.Dict[typing.Any, int] = {}
+        for position, raw_table in enumerate(raw_tables):
+            value_name = f'{self.name}[{position}]'
+            self._check_table_type(raw_table, value_name)
+            key_value = self._get_key_value(raw_table, key, value_name)
+            self._check_key_type(key, key_value, value_name)
+            if key_value in positions:
+                raise DuplicateTableIndexError(value_name, key_name, key_value)
+            positions[key_value] = position
+        return TableIndex(positions, tables)
+
+    def _raw_tables(self) -> list:
+        raw_value = self._memoized_raw_value
+        return [raw_value] if isinstance(raw_value, dict) else raw_value
+
+    def _build_table(self, raw_value) -> typing.Union[dict, TableArray]:
+        if isinstance(raw_value, dict):
+            validated: typing.Union[dict, TableArray] = self._validate_table(raw_value, self.name)
+        elif isinstance(raw_value, list):
+            validated = TableArray(raw_value, self._check_table)
+        else:
+            self._raise_invalid_type_error(raw_value)
+        if isinstance(validated, dict):
+            # the validated table is shared with the indexes and item access, which must not let it be modified
+            raw_tables, tables = [raw_value], [types.MappingProxyType(validated)]
+        else:
+            raw_tables, tables = raw_value, validated
+        indexes = {key_name: self._build_index(raw_tables, tables, key_name) for key_name in self._index_on}
+        self._tables, self._indexes, self._columns = tables, indexes, {}
+        return validated
+
+    def _cast(self, raw_value) -> typing.Union[dict, TableArray]:
+        return self._cast_memoized(raw_value, self._build_table)
 
-    def _cast(self, raw_value) -> dict:
-        if not isinstance(raw_value, dict):
-            self._raise_invalid_type_error()
-        raw_value_as_dict = self._check_keys(dict(raw_value))
-        return raw_value_as_dict
+    def _build_column(self, key: ConfigValueTableKey, type_code: str) -> typing.Any:
+        # only the requested key is checked here, the rest of each table is still validated lazily
+        column = array.array(type_code)
+        for position, raw_table in enumerate(self._raw_tables()):
+            value_name = f'{self.name}[{position}]'
+            self._check_table_type(raw_table, value_name)
+            key_value = self._get_key_value(raw_table, key, value_name)
+            self._check_key_type(key, key_value, value_name)
+            column.append(key_value)
+        numpy = _numpy()
+        if numpy is None:
+            return column
+        numpy_column = numpy.array(column, dtype=_NUMPY_DTYPES[type_code])
+        numpy_column.flags.writeable = False
+        return numpy_column
 
-    # pylint: disable=useless-super-delegation
-    def __call__(self) -> dict:
-        return super(ConfigValueTableArray, self).__call__()
+    def column(self, key_name: str) -> typing.Any:
+        """
+        Returns the values of a key for all the tables, in a compact array
+
+        The array is shared between calls until the config changes, and must not be modified.
+
+        :param key_name: name of a declared key of type int, float or bool
+        :return: a (read-only) numpy array if numpy is installed, an array.array otherwise
+        """
+        try:
+            key = self._keys_by_name[key_name]
+        except KeyError:
+            raise KeyError(f'{self.name}: table has no key "{key_name}"')
+        try:
+            type_code = _COLUMN_TYPE_CODES[key.key_type]
+        except KeyError:
+            raise TypeError(f'{self.name}: key "{key_name}" of type "{key.user_friendly_type}" cannot be read as a '
+                            f'column')
+        # resolving the value drops the columns if the config has changed
+        super(ConfigValueTableArray, self).__call__()
+        try:
+            return self._columns[key_name]
+        except KeyError:
+            column = self._columns[key_name] = self._build_column(key, type_code)
+            return column
+
+    def index(self, key_name: str) -> TableIndex:
+        """
+        :param key_name: name of an index key (see ``index_on``)
+        :return: read-only mapping of the values of this key to the tables that hold them
+        """
+        if key_name not in self._index_on:
+            raise KeyError(f'{self.name}: not an index key: {key_name}')
+        # resolving the value (re)builds the indexes if the config has changed
+        super(ConfigValueTableArray, self).__call__()
+        return self._indexes[key_name]
+
+    def __call__(self) -> typing.Union[dict, TableArray]:
+        value = super(ConfigValueTableArray, self).__call__()
+        if isinstance(value, dict):
+            return dict(value)
+        return value
 
     def __getattr__(self, item):
-        if item in (key.key_name for key in self.keys):
-            return self()[item]
+        if item.startswith('_'):
+            # slot that has not been set yet
+            raise AttributeError(item)
+        if item.startswith('by_') and item[3:] in self._index_on:
+            return self.index(item[3:])
+        if item in self._keys_by_name:
+            value = super(ConfigValueTableArray, self).__call__()
+            if not isinstance(value, dict):
+                raise AttributeError(f'{self.name}: array of tables has no key "{item}" (index it first)')
+            return value[item]
 
         raise AttributeError(f'{self.name}: table has no key "{item}"')
 
     def __getitem__(self, item):
+        if isinstance(item, int):
+            # resolving the value (re)builds the tables if the config has changed; a single table is an array of one
+            super(ConfigValueTableArray, self).__call__()
+            return self._tables[item]
         return self.__getattr__(item)
 
+    def _build_example_fingerprint(self) -> str:
+        keys = (
+            '\x1f'.join((key.key_name, key.key_type.__qualname__, key.description,
+                         '<no default>' if key.mandatory else repr(key.default)))
+            for key in self.keys
+        )
+        return '\x1e'.join((super(ConfigValueTableArray, self)._build_example_fingerprint(), *keys))
+
     @staticmethod
     def _get_key_state_as_comment(key: ConfigValueTableKey) -> str:
         if key.mandatory:
@@ -116,10 +310,10 @@ class ConfigValueTableArray(ConfigValue):
 
         return 'This key is optional, and has a default value of: ' + str(key.default)
 
-    def _toml_add_value_type(self, toml_obj: tomlkit.container.Container):
-        self._toml_comment(toml_obj, f'value type: {self.friendly_type_name}')
-        self._toml_comment(toml_obj, '')
-        self._toml_comment(toml_obj, 'Type of keys:')
+    def _toml_add_value_type(self, lines: typing.List[str]):
+        self._toml_comment(lines, f'value type: {self.friendly_type_name}')
+        self._toml_comment(lines, '')
+        self._toml_comment(lines, 'Type of keys:')
         for key in self.keys:
             _key_state = self._get_key_state_as_comment(key)
             for comment in [f'key name: {key.key_name}',
@@ -128,10 +322,10 @@ class ConfigValueTableArray(ConfigValue):
                             _key_state,
                             '',
                             ]:
-                toml_obj.add(tomlkit.comment((' ' * 4 + comment).rstrip()))
+                self._toml_comment(lines, (' ' * 4 + comment).rstrip())
 
     @staticmethod
-    def _add_key_to_example_table(_table: tomlkit.container.Container, key: ConfigValueTableKey):
+    def _render_example_key(key: ConfigValueTableKey) -> str:
         if not key.mandatory:
             _value = key.default
         else:
@@ -141,36 +335,27 @@ class ConfigValueTableArray(ConfigValue):
                 # noinspection PyTypeChecker
                 _value = _KEY_VALUE_EXAMPLES[key.key_type]
 
-        _table[key.key_name] = _value
+        return render_key_value(key.key_name, _value)
 
     def _generate_example(self) -> typing.List[str]:
-        _doc = tomlkit.document()
-        _table = tomlkit.table()
-        for key in self.keys:
-            self._add_key_to_example_table(_table, key)
-        _array = tomlkit.aot()
-        _array.append(_table)
-        _doc[self.key] = _array
-        return _doc.as_string().split('\n')
-
-    def _toml_add_examples(self, toml_obj: tomlkit.container.Container):
-        self._toml_comment(toml_obj, 'An array of tables is a list of table that share a common schema of '
-                                     'key/value pairs.')
-        self._toml_comment(toml_obj, r'example:')
+        _example = f'[[{render_key(self.key)}]]\n' + ''.join(self._render_example_key(key) for key in self.keys)
+        return _example.split('\n')
+
+    def _toml_add_examples(self, lines: typing.List[str]):
+        self._toml_comment(lines, 'An array of tables is a list of table that share a common schema of '
+                                  'key/value pairs.')
+        self._toml_comment(lines, r'example:')
         for line in self._generate_example():
-            self._toml_comment(toml_obj, (' ' * 4 + line).rstrip())
-        self._toml_comment(toml_obj, r'NOTE: the above example can be repeated as many times as needed, to create '
-                                     r'multiple tables in the array.')
+            self._toml_comment(lines, (' ' * 4 + line).rstrip())
+        self._toml_comment(lines, r'NOTE: the above example can be repeated as many times as needed, to create '
+                                  r'multiple tables in the array.')
 
-    def _toml_add_comments(self, toml_obj: tomlkit.container.Container):
-        super(ConfigValueTableArray, self)._toml_add_comments(toml_obj)
+    def _toml_add_comments(self, lines: typing.List[str]):
+        super(ConfigValueTableArray, self)._toml_add_comments(lines)
 
-    def _toml_add_value(self, toml_obj: tomlkit.container.Container, not_set: str):
+    def _toml_add_value(self, lines: typing.List[str]):
         if self.default != SENTINEL:
-            _doc = tomlkit.document()
-            _doc[self.key] = self.default
-            for line in _doc.as_string().split('\n'):
-                self._toml_comment(toml_obj, line)
+            for line in render_key_value(self.key, self.default).split('\n'):
+                self._toml_comment(lines, line)
         else:
-            toml_obj[self.key] = not_set
-            toml_obj.add(tomlkit.nl())
+            super(ConfigValueTableArray, self)._toml_add_value(lines)
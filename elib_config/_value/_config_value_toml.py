@@ -12,7 +12,7 @@ They also have a description, which will be used to create the example config fi
 import abc
 import typing
 
-import tomlkit.container
+from ._toml_render import render_key, render_key_value
 
 SENTINEL: typing.Any = object()
 
@@ -20,9 +20,15 @@ SENTINEL: typing.Any = object()
 class ConfigValueTOML(abc.ABC):
     """
     Abstract base class for config values that can be translated to TOML
+
+    The example of a value is built as a list of lines of TOML text (lines may contain line breaks). The example of a
+    value is rendered once, and rendered again only after its description, default or constraints have changed.
     """
+    __slots__ = ()
     description: str
     default: typing.Any  # noqa
+    _example_fragment: typing.Optional[str]
+    _example_fingerprint_cache: typing.Optional[str]
 
     @property
     @abc.abstractmethod
@@ -40,52 +46,70 @@ class ConfigValueTOML(abc.ABC):
         :rtype: str
         """
 
-    def _toml_add_description(self, toml_obj: tomlkit.container.Container):
-        toml_obj.add(tomlkit.comment(self.description))
+    def _toml_add_description(self, lines: typing.List[str]):
+        self._toml_comment(lines, self.description)
 
-    def _toml_add_value_type(self, toml_obj: tomlkit.container.Container):
-        toml_obj.add(tomlkit.comment(f'value type: {self.friendly_type_name}'))
+    def _toml_add_value_type(self, lines: typing.List[str]):
+        self._toml_comment(lines, f'value type: {self.friendly_type_name}')
 
-    def _toml_add_comments(self, toml_obj: tomlkit.container.Container):
-        self._toml_add_examples(toml_obj)
+    def _toml_add_comments(self, lines: typing.List[str]):
+        self._toml_add_examples(lines)
         if self.default != SENTINEL:
             comments = [
                 'Setting this value is not required; you can leave it commented out.',
                 'The default value (the one that will be used if you do not provide another) is shown below:',
             ]
             for comment in comments:
-                toml_obj.add(tomlkit.comment(comment))
+                self._toml_comment(lines, comment)
         else:
-            toml_obj.add(tomlkit.comment('MANDATORY CONFIG VALUE: you *must* provide a value for this setting'))
+            self._toml_comment(lines, 'MANDATORY CONFIG VALUE: you *must* provide a value for this setting')
+
+    def _to_toml(self, value: typing.Any) -> typing.Any:
+        """
+        :param value: checked value
+        :return: the value, as it can be stored in the config file
+        """
+        return value
 
-    def _toml_add_value(self, toml_obj: tomlkit.container.Container, not_set: str):
+    def _toml_add_value(self, lines: typing.List[str]):
         if self.default != SENTINEL:
-            _doc = tomlkit.document()
-            _doc[self.key] = self.default
-            toml_obj.add(tomlkit.comment(_doc.as_string()))
+            self._toml_comment(lines, render_key_value(self.key, self._to_toml(self.default)))
         else:
-            toml_obj[self.key] = not_set
-            toml_obj.add(tomlkit.nl())
+            lines.append(f'{render_key(self.key)} = ')
+            lines.append('')
 
     @staticmethod
-    def _toml_comment(toml_obj: tomlkit.container.Container, comment: str):
-        toml_obj.add(tomlkit.comment(comment))
+    def _toml_comment(lines: typing.List[str], comment: str):
+        lines.append(f'# {comment}')
 
     @abc.abstractmethod
-    def _toml_add_examples(self, toml_obj: tomlkit.container.Container):
+    def _toml_add_examples(self, lines: typing.List[str]):
         pass
 
-    def add_to_toml_obj(self, toml_obj: tomlkit.container.Container, not_set: str):
+    def _example_fingerprint(self) -> str:
+        """
+        :return: everything the example of this value depends on, as a string
+        """
+        if self._example_fingerprint_cache is None:
+            self._example_fingerprint_cache = self._build_example_fingerprint()
+        return self._example_fingerprint_cache
+
+    def _build_example_fingerprint(self) -> str:
+        default = '<no default>' if self.default is SENTINEL else repr(self._to_toml(self.default))
+        return '\x1f'.join((type(self).__qualname__, self.key, self.description, self.friendly_type_name, default))
+
+    def add_to_example(self, lines: typing.List[str]):
         """
-        Updates the given container in-place with this ConfigValue
+        Appends the example of this value (description, type, examples and default) to an example config file
 
-        :param toml_obj: container to update
-        :type toml_obj: tomlkit.container.Containers
-        :param not_set: random UUID used to denote a value that has no default
-        :type not_set: str
+        :param lines: lines of the example config file
         """
-        self._toml_add_description(toml_obj)
-        self._toml_add_value_type(toml_obj)
-        self._toml_add_comments(toml_obj)
-        toml_obj.add(tomlkit.comment(''))
-        self._toml_add_value(toml_obj, not_set)
+        if self._example_fragment is None:
+            fragment: typing.List[str] = []
+            self._toml_add_description(fragment)
+            self._toml_add_value_type(fragment)
+            self._toml_add_comments(fragment)
+            self._toml_comment(fragment, '')
+            self._toml_add_value(fragment)
+            self._example_fragment = '\n'.join(fragment)
+        lines.append(self._example_fragment)
@@ -105,3 +105,11 @@ class TableKeyTypeError(_ConfigValueError):
     def __init__(self, value_name: str, key_name: str, key_expected_type, key_actual_type):
         msg = f'{key_name}: expected a value of type "{key_expected_type}", got "{key_actual_type}" instead'
         super(TableKeyTypeError, self).__init__(value_name, msg)
+
+
+class DuplicateTableIndexError(_ConfigValueError):
+    """Raised when two tables in an array of tables share the same value for an index key"""
+
+    def __init__(self, value_name: str, key_name: str, key_value: typing.Any) -> None:
+        super(DuplicateTableIndexError, self).__init__(value_name, f'duplicate value for index key "{key_name}": '
+                                                                   f'{key_value!r}')
@@ -0,0 +1,193 @@
+# coding=utf-8
+"""
+Registry of all declared config values
+
+Values are indexed by their path components (as resolved with the current separator, without the root path), and in
+a trie of those components: ``ConfigValue('a', 'b')`` and ``ConfigValue('a__b')`` share the same path. The index is
+built when it is first needed, and built again once values are added or the setup of elib_config changes.
+"""
+import typing
+from collections import defaultdict
+
+from elib_config._setup import ELIBConfig
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    # noinspection PyProtectedMember
+    from elib_config._value._config_value import ConfigValue  # noqa: F401 pylint: disable=unused-import
+
+
+class _TrieNode:
+    __slots__ = ('children', 'value')
+
+    def __init__(self) -> None:
+        # most nodes are leaves: their children are only allocated when needed
+        self.children: typing.Optional[typing.Dict[str, _TrieNode]] = None
+        self.value: typing.Optional['ConfigValue'] = None
+
+    def child(self, component: str) -> typing.Optional['_TrieNode']:
+        """
+        :param component: path component
+        :return: the child node for this component, if any
+        """
+        return None if self.children is None else self.children.get(component)
+
+    def add_child(self, component: str) -> '_TrieNode':
+        """
+        :param component: path component
+        :return: the child node for this component, created if needed
+        """
+        if self.children is None:
+            self.children = {}
+        try:
+            return self.children[component]
+        except KeyError:
+            node = self.children[component] = _TrieNode()
+            return node
+
+
+def _path_components(raw_path: typing.Sequence[str]) -> typing.Tuple[str, ...]:
+    separator = ELIBConfig.config_sep_str
+    if not any(separator in component for component in raw_path):
+        # keeps the components given at declaration, rather than copies of them
+        return tuple(raw_path)
+    return tuple(separator.join(raw_path).split(separator))
+
+
+def _nested_default_dict() -> defaultdict:
+    return defaultdict(_nested_default_dict)
+
+
+def _default_dict_to_dict(source) -> dict:
+    for key, value in source.items():
+        if isinstance(value, dict):
+            source[key] = _default_dict_to_dict(value)
+    return dict(source)
+
+
+def aggregate_config_values(config_values: typing.Iterable['ConfigValue']) -> dict:
+    """
+    Returns a tree of config values, as nested dictionaries indexed by path components, sorted by value name
+
+    :param config_values: config values to aggregate
+    :return: nested dictionaries of config values
+    """
+    _keys: defaultdict = _nested_default_dict()
+    _sorted_values = sorted(config_values, key=lambda x: x.name)
+    for value in _sorted_values:
+        value_keys = value.path_keys
+        this_config_key = _keys
+        for sub_key in value_keys[:-1]:
+            this_config_key = this_config_key[sub_key]
+        this_config_key[value_keys[-1]] = value
+    return _default_dict_to_dict(_keys)
+
+
+class ConfigValueRegistry:
+    """
+    Registry of all declared config values
+    """
+
+    def __init__(self) -> None:
+        self._values: typing.List['ConfigValue'] = []
+        self._trie = _TrieNode()
+        self._duplicates: typing.Set['ConfigValue'] = set()
+        self._version: int = 0
+        self._index_key: typing.Tuple[int, int] = (-1, -1)
+        self._tree: typing.Optional[dict] = None
+        self._tree_key: typing.Tuple[int, int] = (-1, -1)
+
+    def register(self, value: 'ConfigValue'):
+        """
+        Adds a config value to the registry
+
+        If another value has been declared with the same path, the one declared last is a duplicate.
+
+        :param value: config value to add
+        """
+        self._values.append(value)
+        self._version += 1
+
+    def _index(self):
+        index_key = (self._version, ELIBConfig.generation)
+        if index_key == self._index_key:
+            return
+        self._trie, self._duplicates = _TrieNode(), set()
+        for value in self._values:
+            node = self._trie
+            # noinspection PyProtectedMember
+            for component in _path_components(value._raw_path):  # pylint: disable=protected-access
+                node = node.add_child(component)
+            if node.value is None:
+                node.value = value
+            else:
+                self._duplicates.add(value)
+        self._index_key = index_key
+
+    def clear(self):
+        """
+        Removes all config values from the registry
+        """
+        self._values.clear()
+        self._version += 1
+
+    def get(self, *raw_path: str) -> typing.Optional['ConfigValue']:
+        """
+        :param raw_path: path components of the value
+        :return: the config value declared with this path, or None
+        """
+        self._index()
+        node = self._find(raw_path)
+        return None if node is None else node.value
+
+    def _find(self, raw_path: typing.Sequence[str]) -> typing.Optional[_TrieNode]:
+        node: typing.Optional[_TrieNode] = self._trie
+        for component in _path_components(raw_path) if raw_path else ():
+            node = node.child(component)
+            if node is None:
+                break
+        return node
+
+    def values_under(self, *prefix: str) -> typing.Iterator['ConfigValue']:
+        """
+        :param prefix: path components
+        :return: all config values which path starts with the given components (excluding duplicates)
+        """
+        self._index()
+        node = self._find(prefix)
+        if node is None:
+            return
+        nodes = [node]
+        while nodes:
+            node = nodes.pop()
+            if node.value is not None:
+                yield node.value
+            if node.children is not None:
+                nodes.extend(reversed(list(node.children.values())))
+
+    def is_duplicate(self, value: 'ConfigValue') -> bool:
+        """
+        :param value: config value
+        :return: True if another value was declared with the same path before this one
+        """
+        self._index()
+        return value in self._duplicates
+
+    def tree(self) -> dict:
+        """
+        The tree is cached until a value is added, or the paths of config values change (see
+        :py:attr:`ELIBConfig.generation`); it must not be mutated. Duplicates are left out of the tree.
+
+        :return: all config values, as nested dictionaries indexed by path components, sorted by value name
+        """
+        tree_key = (self._version, ELIBConfig.generation)
+        if self._tree is None or tree_key != self._tree_key:
+            self._index()
+            values = [value for value in self._values if value not in self._duplicates]
+            self._tree, self._tree_key = aggregate_config_values(values), tree_key
+        return self._tree
+
+    def __iter__(self) -> typing.Iterator['ConfigValue']:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,85 @@
+# coding=utf-8
+"""
+Lazy sequence of tables, and indexes over it, for config values that are arrays of tables
+"""
+import collections.abc
+import types
+import typing
+
+
+class TableArray(collections.abc.Sequence):
+    """
+    Read-only sequence of tables
+
+    Each table is validated the first time it is accessed, so large arrays do not pay for the validation of tables
+    that are never used. Validated tables are shared between callers, and are therefore returned as read-only
+    mappings.
+    """
+    __slots__ = ('_raw_tables', '_tables', '_validate_table')
+
+    def __init__(self,
+                 raw_tables: typing.Sequence[typing.Any],
+                 validate_table: typing.Callable[[typing.Any, int], dict],
+                 ) -> None:
+        """
+        :param raw_tables: tables as read from the config file
+        :param validate_table: callable that takes a raw table and its index, and returns the validated table
+        """
+        self._raw_tables = raw_tables
+        self._tables: typing.List[typing.Optional[typing.Mapping[str, typing.Any]]] = [None] * len(raw_tables)
+        self._validate_table = validate_table
+
+    def _get(self, index: int) -> typing.Mapping[str, typing.Any]:
+        table = self._tables[index]
+        if table is None:
+            table = self._tables[index] = types.MappingProxyType(self._validate_table(self._raw_tables[index], index))
+        return table
+
+    def __len__(self) -> int:
+        return len(self._raw_tables)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._get(_index) for _index in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('table array index out of range')
+        return self._get(index)
+
+    def __iter__(self) -> typing.Iterator[typing.Mapping[str, typing.Any]]:
+        for index in range(len(self)):
+            yield self._get(index)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self)} tables)'
+
+
+class TableIndex(collections.abc.Mapping):
+    """
+    Read-only mapping of the values of an index key to the tables that hold them
+    """
+    __slots__ = ('_positions', '_tables')
+
+    def __init__(self,
+                 positions: typing.Dict[typing.Any, int],
+                 tables: typing.Sequence[typing.Mapping[str, typing.Any]],
+                 ) -> None:
+        """
+        :param positions: position of the table in the array, for each value of the index key
+        :param tables: (lazily validated) tables of the array
+        """
+        self._positions = positions
+        self._tables = tables
+
+    def __getitem__(self, key_value) -> typing.Mapping[str, typing.Any]:
+        return self._tables[self._positions[key_value]]
+
+    def __iter__(self) -> typing.Iterator[typing.Any]:
+        return iter(self._positions)
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self)} keys)'
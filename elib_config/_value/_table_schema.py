@@ -0,0 +1,71 @@
+# coding=utf-8
+"""
+Compiles the keys of a table into a specialized validator function
+
+The generated function checks the presence and the type of every key, and injects defaults, in straight-line code:
+there is no loop over the keys and no method call per key. It returns a new dict and never modifies the raw table.
+
+Validators are compiled once per schema signature (the name, type and presence of a default of each key): tables
+that share a signature share the same function, and their keys (for defaults and error messages) are bound at call
+time.
+"""
+import functools
+import typing
+
+from elib_config._utils import friendly_type_name
+from ._exc import MissingTableKeyError, TableKeyTypeError
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from ._config_value_table import ConfigValueTableKey  # noqa: F401 pylint: disable=unused-import
+
+TableValidator = typing.Callable[[typing.Mapping[str, typing.Any], str], dict]
+_Signature = typing.Tuple[typing.Tuple[str, typing.Type, bool], ...]
+
+_MANDATORY_KEY = '''
+    try:
+        value = raw_table[{key_name!r}]
+    except KeyError:
+        raise MissingTableKeyError(value_name, str(keys[{index}]))
+    if not isinstance(value, key_type_{index}):
+        raise TableKeyTypeError(value_name, {key_name!r}, expected_type_{index}, friendly_type_name(type(value)))
+'''
+
+_OPTIONAL_KEY = '''
+    value = raw_table.get({key_name!r}, missing)
+    if value is missing:
+        value = table[{key_name!r}] = keys[{index}].default
+    if not isinstance(value, key_type_{index}):
+        raise TableKeyTypeError(value_name, {key_name!r}, expected_type_{index}, friendly_type_name(type(value)))
+'''
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(signature: _Signature) -> typing.Callable[..., dict]:
+    missing = object()
+    namespace: typing.Dict[str, typing.Any] = {
+        'MissingTableKeyError': MissingTableKeyError,
+        'TableKeyTypeError': TableKeyTypeError,
+        'friendly_type_name': friendly_type_name,
+        'missing': missing,
+    }
+    lines = ['def validate_table(keys, raw_table, value_name):', '    table = dict(raw_table)']
+    for index, (key_name, key_type, mandatory) in enumerate(signature):
+        namespace[f'key_type_{index}'] = key_type
+        namespace[f'expected_type_{index}'] = friendly_type_name(key_type)
+        template = _MANDATORY_KEY if mandatory else _OPTIONAL_KEY
+        lines.append(template.format(key_name=key_name, index=index))
+    lines.append('    return table')
+    exec(compile('\n'.join(lines), '<table validator>', 'exec'), namespace)  # pylint: disable=exec-used
+    return namespace['validate_table']
+
+
+def compile_table_validator(keys: typing.Sequence['ConfigValueTableKey']) -> TableValidator:
+    """
+    Generates the validator for a table schema
+
+    :param keys: keys of the table
+    :return: function that takes a raw table and the name to use in error messages, and returns the validated table
+    """
+    keys = tuple(keys)
+    signature = tuple((key.key_name, key.key_type, key.mandatory) for key in keys)
+    return functools.partial(_compile(signature), keys)
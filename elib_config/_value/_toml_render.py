@@ -0,0 +1,62 @@
+# coding=utf-8
+"""
+Renders TOML keys and values as text, the way tomlkit renders them
+
+Scalars are rendered directly; anything else (arrays, tables, dates, ...) is handed over to tomlkit.
+"""
+import string
+import typing
+
+_BARE_KEY_CHARS = frozenset(string.ascii_letters + string.digits + '-_')
+_ESCAPES = {
+    '"': '\\"',
+    '\\': '\\\\',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+    '\b': '\\b',
+    '\f': '\\f',
+}
+
+
+def render_key(key: str) -> str:
+    """
+    :param key: key to render
+    :return: the key, quoted if it is not a bare key
+    """
+    if _BARE_KEY_CHARS.issuperset(key):
+        return key
+    return f'"{key}"'
+
+
+def _escape_string(value: str) -> str:
+    if not any(char in _ESCAPES or char < ' ' for char in value):
+        return value
+    return ''.join(_ESCAPES.get(char, f'\\u{ord(char):04x}' if char < ' ' else char) for char in value)
+
+
+def _render_scalar(value: typing.Any) -> typing.Optional[str]:
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, str):
+        return f'"{_escape_string(value)}"'
+    return None
+
+
+def render_key_value(key: str, value: typing.Any) -> str:
+    """
+    Renders a value as it would be rendered in a TOML document on its own
+
+    :param key: key of the value
+    :param value: value to render
+    :return: TOML text, ending with a new line
+    """
+    rendered_value = _render_scalar(value)
+    if rendered_value is not None:
+        return f'{render_key(key)} = {rendered_value}\n'
+    import tomlkit
+    document = tomlkit.document()
+    document[key] = value
+    return document.as_string()
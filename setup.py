@@ -68,7 +68,7 @@ setup(
     description="My own poor little attempt at a config lib",
     license='MIT',
     long_description=read_local_files('README.md'),
-    packages=find_packages(),
+    packages=find_packages(exclude=('benchmarks',)),
     package_data={
         'elib_config': 'test'
     },
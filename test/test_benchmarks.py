@@ -0,0 +1,47 @@
+# coding=utf-8
+"""
+Tests the comparison logic of the benchmark suite
+"""
+import json
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks._compare import find_regressions, format_comparison
+
+
+def _results(**timings):
+    return {name: {'seconds': seconds, 'iterations': 1} for name, seconds in timings.items()}
+
+
+@pytest.mark.parametrize(
+    'current, expected',
+    [
+        (1.0, []),
+        (1.19, []),
+        (1.21, ['bench']),
+        (0.5, []),
+    ]
+)
+def test_find_regressions(current, expected):
+    assert expected == find_regressions(_results(bench=1.0), _results(bench=current), threshold=0.2)
+
+
+def test_find_regressions_ignores_new_and_removed_benchmarks():
+    assert [] == find_regressions(_results(old=1.0), _results(new=100.0), threshold=0.2)
+
+
+def test_format_comparison():
+    lines = format_comparison(_results(bench=1.0), _results(bench=2.0, new=1.0))
+    assert 3 == len(lines)
+    assert lines[1].startswith('bench')
+    assert lines[1].endswith('2.00')
+    assert lines[2].startswith('new')
+
+
+@pytest.mark.parametrize('current, expected_exit_code', [(1.0, 0), (2.0, 1)])
+def test_compare_command(current, expected_exit_code):
+    for file_name, seconds in (('baseline.json', 1.0), ('current.json', current)):
+        with open(file_name, 'w') as stream:
+            json.dump({'results': _results(bench=seconds)}, stream)
+    assert expected_exit_code == main(['compare', 'baseline.json', 'current.json'])
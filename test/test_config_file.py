@@ -65,3 +65,51 @@ def test_write_file():
     _config_file._write_file(new_config)
     assert config_file_path.exists()
     assert _config_file.read_config_file() == new_config
+
+
+def test_read_config_file_cached():
+    config_file_path = pathlib.Path('config.toml')
+    config_file_path.write_text('key = "value"')
+    config = _config_file.read_config_file()
+    assert config is _config_file.read_config_file()
+    config_file_path.write_text('key = "other value"')
+    new_config = _config_file.read_config_file()
+    assert new_config is not config
+    assert new_config['key'] == 'other value'
+
+
+def test_read_config_file_invalidate():
+    pathlib.Path('config.toml').write_text('key = "value"')
+    config = _config_file.read_config_file()
+    _config_file.invalidate()
+    assert config is not _config_file.read_config_file()
+    assert config == _config_file.read_config_file()
+
+
+@pytest.mark.parametrize('fallback_to_tomlkit', [False, True])
+def test_read_file_plain_types(fallback_to_tomlkit, monkeypatch):
+    if fallback_to_tomlkit:
+        monkeypatch.setattr(_config_file, '_toml_reader', lambda: None)
+    pathlib.Path('config.toml').write_text("""
+    string = "value"
+    integer = 1
+    float = 1.0
+    boolean = true
+    array = [1, 2]
+    inline = {key = "value"}
+    [table]
+    key = "value"
+    [[tables]]
+    key = "value"
+    """)
+    config = _config_file._read_file()
+    assert type(config) is dict
+    assert type(config['string']) is str
+    assert type(config['integer']) is int
+    assert type(config['float']) is float
+    assert type(config['boolean']) is bool
+    assert type(config['array']) is list
+    assert type(config['array'][0]) is int
+    assert type(config['inline']) is dict
+    assert type(config['table']) is dict
+    assert type(config['tables'][0]) is dict
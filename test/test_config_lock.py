@@ -0,0 +1,135 @@
+# coding=utf-8
+
+import os
+import pathlib
+import stat
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+import elib_config
+# noinspection PyProtectedMember
+from elib_config._file import _config_file
+# noinspection PyProtectedMember
+from elib_config._file._lock import ConfigLock
+
+_PACKAGE_ROOT = str(pathlib.Path(elib_config.__file__).parent.parent)
+
+_READER = '''
+import sys
+sys.path.insert(0, {package_root!r})
+from elib_config import ELIBConfig
+from elib_config._file import _config_file
+ELIBConfig.setup(app_version='0.1', app_name='test', config_file_path={config_file_path!r}, config_sep_str='__')
+for _ in range({reads}):
+    config = _config_file._read_file()
+    if len(config.get('payload', '')) != config.get('size'):
+        sys.exit('torn read')
+'''
+
+
+def _config(size: int) -> dict:
+    return {'size': size, 'payload': 'x' * size}
+
+
+def test_readers_share_the_lock():
+    lock = ConfigLock()
+    barrier = threading.Barrier(3, timeout=5)
+
+    def _read():
+        with lock.read():
+            barrier.wait()
+
+    threads = [threading.Thread(target=_read) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+
+
+def test_writer_is_exclusive():
+    lock = ConfigLock()
+    events = []
+    reading = threading.Event()
+
+    def _write():
+        reading.wait()
+        with lock.write():
+            events.append('write')
+
+    thread = threading.Thread(target=_write)
+    thread.start()
+    with lock.read():
+        reading.set()
+        time.sleep(0.1)
+        events.append('read')
+    thread.join()
+    assert ['read', 'write'] == events
+
+
+def test_lock_is_reentrant():
+    lock = ConfigLock()
+    with lock.write():
+        with lock.write():
+            with lock.read():
+                pass
+    with lock.read():
+        with lock.read():
+            with pytest.raises(RuntimeError):
+                with lock.write():
+                    pass
+    with lock.write():
+        pass
+
+
+def test_write_file_is_atomic():
+    config_file_path = pathlib.Path('config.toml')
+    config_file_path.write_text('key = "value"')
+    os.chmod(str(config_file_path), 0o600)
+    _config_file._write_file({'key': 'other value'})
+    assert 'other value' == _config_file.read_config_file()['key']
+    assert 0o600 == stat.S_IMODE(config_file_path.stat().st_mode)
+    assert not list(pathlib.Path('.').glob('*.tmp'))
+
+
+def test_concurrent_readers_and_writer():
+    errors = []
+    done = threading.Event()
+
+    def _read():
+        while not done.is_set():
+            try:
+                config = _config_file._read_file()
+            except Exception as error:  # pylint: disable=broad-except
+                errors.append(error)
+            else:
+                if len(config.get('payload', '')) != config.get('size'):
+                    errors.append(config)
+
+    _config_file._write_file(_config(1))
+    threads = [threading.Thread(target=_read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for size in range(1, 20):
+        _config_file._write_file(_config(size * 1000))
+    done.set()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+
+@pytest.mark.long
+def test_reader_processes_never_see_torn_files():
+    config_file_path = str(pathlib.Path('config.toml').absolute())
+    _config_file._write_file(_config(1))
+    code = _READER.format(package_root=_PACKAGE_ROOT, config_file_path=config_file_path, reads=100)
+    readers = [subprocess.Popen([sys.executable, '-c', code]) for _ in range(8)]
+    size = 1
+    while any(reader.poll() is None for reader in readers):
+        size = size % 50 + 1
+        _config_file._write_file(_config(size * 1000))
+    assert all(reader.returncode == 0 for reader in readers)
@@ -6,7 +6,10 @@ import pathlib
 import pytest
 import tomlkit.container
 
-from elib_config import MissingValueError
+import elib_config
+from elib_config import MissingValueError, _setup
+# noinspection PyProtectedMember
+from elib_config._file import _config_file
 # noinspection PyProtectedMember
 from elib_config._value import _config_value
 
@@ -74,3 +77,120 @@ def test_value_in_config_file(dummy_value):
 def test_config_value_name(value_name):
     config_value = DummyConfigValue(*value_name, description='')
     assert '.'.join(value_name) == config_value.name
+
+
+def test_config_value_paths_cached(dummy_value):
+    path = dummy_value.path
+    assert path is dummy_value.path
+    assert dummy_value.name is dummy_value.name
+    assert dummy_value.var_name == 'TEST__DUMMY__TEST__CONFIG_VALUE'
+    assert dummy_value.var_name is dummy_value.var_name
+
+
+def test_config_value_paths_setup_changed(dummy_value):
+    path = dummy_value.path
+    _setup.ELIBConfig.setup(app_version='0.1', app_name='test', config_file_path='config.toml', config_sep_str='__')
+    assert path is dummy_value.path
+    _setup.ELIBConfig.setup(
+        app_version='0.1', app_name='other', config_file_path='config.toml', config_sep_str='__', root_path=['root']
+    )
+    assert dummy_value.path == 'root__dummy__test__config_value'
+    assert dummy_value.name == 'root.dummy.test.config_value'
+    assert dummy_value.var_name == 'OTHER__ROOT__DUMMY__TEST__CONFIG_VALUE'
+
+
+class CountingConfigValue(DummyConfigValue):
+    cast_count = 0
+
+    def _cast(self, raw_value):
+        self.cast_count += 1
+        return raw_value
+
+
+@pytest.fixture(name='counting_value')
+def _counting_value():
+    yield CountingConfigValue('dummy', 'test', 'config_value', description='test description', default='default')
+
+
+def test_cache_policy_never(counting_value):
+    assert counting_value() == counting_value() == 'default'
+    assert counting_value.cast_count == 2
+
+
+def test_cache_policy_forever(counting_value):
+    counting_value.set_cache_policy(_config_value.CachePolicy.forever)
+    assert counting_value() == counting_value() == 'default'
+    assert counting_value.cast_count == 1
+    _config_file.invalidate()
+    assert counting_value() == 'default'
+    assert counting_value.cast_count == 1
+    counting_value.default = 'other default'
+    assert counting_value() == 'other default'
+    assert counting_value.cast_count == 2
+
+
+def test_cache_policy_generation(counting_value, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_config_value.time, 'monotonic', lambda: now[0])
+    monkeypatch.setattr(_config_value.ConfigGeneration, 'next_check', 0.0)
+    elib_config.refresh_environ()
+    counting_value.set_cache_policy(_config_value.CachePolicy.generation)
+    assert counting_value() == counting_value() == 'default'
+    assert counting_value.cast_count == 1
+    pathlib.Path('config.toml').write_text('[dummy.test]\nconfig_value = "some value"')
+    assert counting_value() == 'default'
+    _config_file.invalidate()
+    assert counting_value() == counting_value() == 'some value'
+    assert counting_value.cast_count == 2
+    pathlib.Path('config.toml').write_text('[dummy.test]\nconfig_value = "other value"')
+    assert counting_value() == 'some value'
+    now[0] += 1
+    assert counting_value() == counting_value() == 'other value'
+    assert counting_value.cast_count == 3
+    os.environ['TEST__DUMMY__TEST__CONFIG_VALUE'] = 'from env'
+    now[0] += 1
+    assert counting_value() == 'from env'
+    os.environ['TEST__DUMMY__TEST__CONFIG_VALUE'] = 'changed env'
+    now[0] += 1
+    assert counting_value() == 'changed env'
+    pathlib.Path('config.toml').unlink()
+    del os.environ['TEST__DUMMY__TEST__CONFIG_VALUE']
+    now[0] += 1
+    assert counting_value() == 'default'
+
+
+def test_cache_policy_ttl(counting_value, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_config_value.time, 'monotonic', lambda: now[0])
+    counting_value.set_cache_policy(10)
+    assert counting_value() == counting_value() == 'default'
+    assert counting_value.cast_count == 1
+    now[0] += 9
+    assert counting_value() == 'default'
+    assert counting_value.cast_count == 1
+    now[0] += 1
+    assert counting_value() == 'default'
+    assert counting_value.cast_count == 2
+
+
+@pytest.mark.parametrize('policy', ['some policy', 0, -1])
+def test_cache_policy_invalid(counting_value, policy):
+    with pytest.raises(ValueError):
+        counting_value.set_cache_policy(policy)
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        lambda: elib_config.ConfigValueBool('value', description=''),
+        lambda: elib_config.ConfigValueString('value', description=''),
+        lambda: elib_config.ConfigValueInteger('value', description=''),
+        lambda: elib_config.ConfigValueFloat('value', description=''),
+        lambda: elib_config.ConfigValueList('value', element_type=str, description=''),
+        lambda: elib_config.ConfigValuePath('value', description=''),
+        lambda: elib_config.ConfigValueSet('value', element_type=str, description=''),
+        lambda: elib_config.ConfigValueTableArray('value', description=''),
+    ]
+)
+def test_config_value_slots(value):
+    assert not hasattr(value(), '__dict__')
@@ -1,11 +1,12 @@
 # coding=utf-8
 
+import array
 import pathlib
 
 import pytest
 
 # noinspection PyProtectedMember
-from elib_config import ConfigValueList, ConfigValueTypeError, MissingValueError, _types, _utils
+from elib_config import ConfigValueList, ConfigValueTypeError, MissingValueError, OutOfBoundError, _types, _utils
 
 
 @pytest.fixture(name='value')
@@ -59,6 +60,18 @@ def test_valid_cast_type_from_config_file(value: ConfigValueList):
     assert value() == ['some', 'other', 'list']
 
 
+@pytest.mark.parametrize('cache_policy', ('never', 'forever'))
+def test_returned_list_is_a_copy(value: ConfigValueList, cache_policy):
+    pathlib.Path('config.toml').write_text('key = ["some", "list"]')
+    value.set_cache_policy(cache_policy)
+    value().append('other')
+    assert value() == ['some', 'list']
+    value.default = ['default']
+    pathlib.Path('config.toml').unlink()
+    value().append('other')
+    assert value() == ['default']
+
+
 @pytest.mark.parametrize(
     'not_a_string',
     (True, False, 10, 10.05, ['another', 'list'], {'a': 'dict'})
@@ -86,3 +99,74 @@ def test_toml_example_unmanaged_element_type():
     value = ConfigValueList('test', element_type=bool, description='')
     with pytest.raises(KeyError):
         value._toml_add_examples({})
+
+
+@pytest.mark.parametrize(
+    'element_type, file_value, expected',
+    [
+        (int, '[1, 2, 3]', array.array('q', [1, 2, 3])),
+        (float, '[1.0, 2.5]', array.array('d', [1.0, 2.5])),
+        (int, '[]', array.array('q')),
+    ]
+)
+def test_compact(element_type, file_value, expected):
+    pathlib.Path('config.toml').write_text(f'key = {file_value}')
+    value = ConfigValueList('key', element_type=element_type, description='', compact=True)
+    result = value()
+    assert isinstance(result, memoryview)
+    assert result.readonly
+    assert expected == result
+    assert expected.tolist() == result.tolist()
+
+
+def test_compact_is_cached():
+    pathlib.Path('config.toml').write_text('key = [1, 2, 3]')
+    value = ConfigValueList('key', element_type=int, description='', compact=True)
+    assert value() is value()
+    pathlib.Path('config.toml').write_text('key = [1, 2, 3, 4]')
+    assert [1, 2, 3, 4] == value().tolist()
+
+
+@pytest.mark.parametrize('compact', (True, False))
+@pytest.mark.parametrize(
+    'element_type, file_value, index, wrong_type',
+    [
+        (int, '[1, 2, 3.0]', 2, 'float'),
+        (float, '[1.0, 2]', 1, 'integer'),
+        (int, '[1, "2"]', 1, 'string'),
+    ]
+)
+def test_compact_wrong_element_type(compact, element_type, file_value, index, wrong_type):
+    pathlib.Path('config.toml').write_text(f'key = {file_value}')
+    value = ConfigValueList('key', element_type=element_type, description='', compact=compact)
+    with pytest.raises(ConfigValueTypeError, match=f'item at index {index} should be .* but is "{wrong_type}"'):
+        value()
+
+
+@pytest.mark.parametrize('compact', (True, False))
+@pytest.mark.parametrize(
+    'min_, max_, out_of_bound',
+    [
+        (2, None, 1),
+        (None, 2, 3),
+        (0, 2, 3),
+    ]
+)
+def test_limits(compact, min_, max_, out_of_bound):
+    pathlib.Path('config.toml').write_text('key = [2, 1, 3]')
+    value = ConfigValueList('key', element_type=int, description='', compact=compact)
+    value.set_limits(1, 3)
+    assert [2, 1, 3] == list(value())
+    value.set_limits(min_, max_)
+    with pytest.raises(OutOfBoundError, match=f'integer out of bound: "{out_of_bound}"'):
+        value()
+
+
+def test_limits_wrong_element_type(value):
+    with pytest.raises(ValueError):
+        value.set_limits(1, 3)
+
+
+def test_compact_wrong_element_type_declaration():
+    with pytest.raises(ValueError, match='compact lists must contain integers or floats, not: string'):
+        ConfigValueList('key', element_type=str, description='', compact=True)
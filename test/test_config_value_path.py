@@ -1,6 +1,8 @@
 # coding=utf-8
 
+import os
 import pathlib
+import time
 
 import pytest
 
@@ -130,3 +132,80 @@ def test_path_value_must_be_both2(value: ConfigValuePath):
     value.must_be_file()
     with pytest.raises(AttributeError):
         value.must_be_dir()
+
+
+@pytest.fixture(name='stat_calls')
+def _count_stat_calls(monkeypatch):
+    calls = []
+    stat = os.stat
+
+    def _stat(path, *args, **kwargs):
+        if str(path) == 'some path':
+            calls.append(path)
+        return stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, 'stat', _stat)
+    yield calls
+
+
+def test_single_stat(value: ConfigValuePath, stat_calls):
+    value.must_exist()
+    value.must_be_dir()
+    pathlib.Path('some path').mkdir()
+    value()
+    assert 1 == len(stat_calls)
+
+
+def test_no_stat_without_constraints(value: ConfigValuePath, stat_calls):
+    value()
+    assert not stat_calls
+
+
+def test_stat_cache(value: ConfigValuePath, stat_calls):
+    value.must_exist()
+    value.set_stat_cache_ttl(60)
+    test_path = pathlib.Path('some path')
+    test_path.touch()
+    value()
+    value()
+    assert 1 == len(stat_calls)
+    test_path.unlink()
+    value()
+    with pytest.raises(PathMustExistError):
+        value.refresh()
+    assert 2 == len(stat_calls)
+
+
+def test_stat_cache_expires(value: ConfigValuePath, stat_calls):
+    value.must_exist()
+    value.set_stat_cache_ttl(0.01)
+    pathlib.Path('some path').touch()
+    value()
+    time.sleep(0.02)
+    value()
+    assert 2 == len(stat_calls)
+
+
+def test_stat_cache_disabled(value: ConfigValuePath, stat_calls):
+    value.must_exist()
+    pathlib.Path('some path').touch()
+    value.set_stat_cache_ttl(60)
+    value()
+    value.set_stat_cache_ttl(0)
+    value()
+    value()
+    assert 3 == len(stat_calls)
+
+
+def test_stat_cache_invalid_ttl(value: ConfigValuePath):
+    with pytest.raises(ValueError):
+        value.set_stat_cache_ttl(-1)
+
+
+def test_stat_cache_create_dir(value: ConfigValuePath):
+    value.create_dir()
+    value.must_be_dir()
+    value.set_stat_cache_ttl(60)
+    value()
+    assert pathlib.Path('some path').is_dir()
+    value()
@@ -0,0 +1,84 @@
+# coding=utf-8
+
+import pathlib
+
+import pytest
+
+from elib_config import ConfigValueSet, ConfigValueTypeError, MissingValueError, OutOfBoundError
+
+
+@pytest.fixture(name='value')
+def _dummy_set_value():
+    yield ConfigValueSet(
+        'key',
+        element_type=str,
+        description='desc',
+        default=['some', 'list', 'some'],
+    )
+
+
+def test_no_default():
+    value = ConfigValueSet('test', 'value', element_type=str, description='test')
+    with pytest.raises(MissingValueError):
+        value()
+
+
+def test_default(value: ConfigValueSet):
+    assert frozenset(('some', 'list')) == value()
+
+
+def test_type_name(value: ConfigValueSet):
+    assert value.type_name == 'array'
+    assert value.friendly_type_name == 'array of strings'
+
+
+def test_from_config_file(value: ConfigValueSet):
+    pathlib.Path('config.toml').write_text('key = ["allowed", "other", "allowed"]')
+    result = value()
+    assert isinstance(result, frozenset)
+    assert frozenset(('allowed', 'other')) == result
+    assert 'allowed' in result
+
+
+def test_cached(value: ConfigValueSet):
+    pathlib.Path('config.toml').write_text('key = ["allowed"]')
+    assert value() is value()
+    pathlib.Path('config.toml').write_text('key = ["allowed", "other"]')
+    assert frozenset(('allowed', 'other')) == value()
+
+
+@pytest.mark.parametrize('file_value', ('"allowed"', '["allowed", 1]'))
+def test_wrong_type(value: ConfigValueSet, file_value):
+    pathlib.Path('config.toml').write_text(f'key = {file_value}')
+    with pytest.raises(ConfigValueTypeError):
+        value()
+
+
+def test_limits():
+    pathlib.Path('config.toml').write_text('key = [1, 2, 3]')
+    value = ConfigValueSet('key', element_type=int, description='')
+    assert frozenset((1, 2, 3)) == value()
+    value.set_limits(2, 3)
+    with pytest.raises(OutOfBoundError):
+        value()
+
+
+def test_set_default():
+    value = ConfigValueSet('key', element_type=str, description='desc', default={'b', 'a'})
+    assert frozenset(('a', 'b')) == value()
+    lines = []
+    value.add_to_example(lines)
+    assert '# key = ["a", "b"]' in lines[0]
+
+
+def test_set_default_wrong_type():
+    value = ConfigValueSet('key', element_type=str, description='desc', default=frozenset((1,)))
+    with pytest.raises(ConfigValueTypeError):
+        value()
+
+
+def test_set():
+    value = ConfigValueSet('key', element_type=str, description='desc')
+    value.set(frozenset(('b', 'a')))
+    assert frozenset(('a', 'b')) == value()
+    assert 'key = ["a", "b"]' in pathlib.Path('config.toml').read_text()
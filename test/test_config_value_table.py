@@ -1,13 +1,16 @@
 # coding=utf-8
 
+import array
 from pathlib import Path
 
 import pytest
 
 from elib_config import (
-    ConfigValueTableArray, ConfigValueTableKey, ConfigValueTypeError, MissingTableKeyError,
-    TableKeyTypeError,
+    ConfigValueTableArray, ConfigValueTableKey, ConfigValueTypeError, DuplicateTableIndexError, MissingTableKeyError,
+    TableArray, TableKeyTypeError, collect_config_errors,
 )
+# noinspection PyProtectedMember
+from elib_config._value import _config_value_table
 
 _EXAMPLE1 = """
 inline_str = { key1= "value1", key2= "other value" } 
@@ -78,3 +81,276 @@ def test_cast_wrong_type():
     inline_str = ConfigValueTableArray('inline_str', description='', keys=(key1,))
     with pytest.raises(ConfigValueTypeError):
         inline_str._cast('test')
+
+
+def test_validated_table_is_cached():
+    Path('config.toml').write_text(_EXAMPLE1)
+    key1 = ConfigValueTableKey('key1', str, description='desc')
+    inline_str = ConfigValueTableArray('inline_str', description='', keys=(key1,))
+    assert 'value1' == inline_str.key1
+    validated_table = inline_str._memoized_value
+    assert 'value1' == inline_str['key1']
+    assert inline_str._memoized_value is validated_table
+    value = inline_str()
+    value['key1'] = 'changed'
+    assert 'value1' == inline_str.key1
+
+
+def test_validated_table_refreshed_on_change():
+    Path('config.toml').write_text(_EXAMPLE1)
+    key1 = ConfigValueTableKey('key1', str, description='desc')
+    inline_str = ConfigValueTableArray('inline_str', description='', keys=(key1,))
+    assert 'value1' == inline_str.key1
+    Path('config.toml').write_text('inline_str = { key1 = "other value" }')
+    assert 'other value' == inline_str.key1
+
+
+def test_validated_table_refreshed_on_keys_change():
+    Path('config.toml').write_text(_EXAMPLE1)
+    key1 = ConfigValueTableKey('key1', str, description='desc')
+    inline_str = ConfigValueTableArray('inline_str', description='', keys=(key1,))
+    assert 'value1' == inline_str.key1
+    inline_str.keys = (ConfigValueTableKey('key1', int, description='desc'),)
+    with pytest.raises(TableKeyTypeError):
+        inline_str()
+
+
+_ARRAY_OF_TABLES = """
+[[servers]]
+name = "first"
+
+[[servers]]
+name = "second"
+port = "not an int"
+
+[[servers]]
+port = 8080
+"""
+
+
+@pytest.fixture(name='servers')
+def _servers():
+    Path('config.toml').write_text(_ARRAY_OF_TABLES)
+    keys = (
+        ConfigValueTableKey('name', str, description=''),
+        ConfigValueTableKey('port', int, description='', default=80),
+    )
+    yield ConfigValueTableArray('servers', description='', keys=keys)
+
+
+def test_array_of_tables(servers):
+    value = servers()
+    assert isinstance(value, TableArray)
+    assert 3 == len(value)
+    assert {'name': 'first', 'port': 80} == value[0]
+    assert {'name': 'first', 'port': 80} == servers[0]
+
+
+def test_array_of_tables_lazy_validation(servers):
+    value = servers()
+    assert {'name': 'first', 'port': 80} == value[-3]
+    with pytest.raises(TableKeyTypeError, match=r'servers\[1\]: port'):
+        _ = value[1]
+    with pytest.raises(MissingTableKeyError) as exc_info:
+        _ = servers[-1]
+    assert 'servers[2]' == exc_info.value.value_name
+
+
+def test_array_of_tables_iteration(servers):
+    iterator = iter(servers())
+    assert 'first' == next(iterator)['name']
+    with pytest.raises(TableKeyTypeError):
+        next(iterator)
+
+
+def test_array_of_tables_index_error(servers):
+    with pytest.raises(IndexError):
+        _ = servers[3]
+    assert [] == servers()[3:]
+
+
+def test_array_of_tables_is_cached(servers):
+    assert servers() is servers()
+    assert servers[0] is servers[0]
+
+
+def test_array_of_tables_is_read_only(servers):
+    with pytest.raises(TypeError):
+        servers[0]['port'] = 8080
+    assert 80 == servers[0]['port']
+
+
+def test_array_of_tables_get_attr(servers):
+    with pytest.raises(AttributeError, match='index it first'):
+        _ = servers.port
+
+
+def test_array_of_tables_wrong_element_type():
+    Path('config.toml').write_text('servers = [1, 2]')
+    servers = ConfigValueTableArray('servers', description='')
+    with pytest.raises(ConfigValueTypeError, match=r'servers\[0\]: expected a table, got "integer"'):
+        _ = servers[0]
+
+
+def test_single_table_index():
+    Path('config.toml').write_text(_EXAMPLE1)
+    inline_str = ConfigValueTableArray('inline_str', description='')
+    assert 'value1' == inline_str[0]['key1']
+    with pytest.raises(IndexError):
+        _ = inline_str[1]
+
+
+_INDEXED = """
+[[hosts]]
+name = "first"
+port = 1
+
+[[hosts]]
+name = "second"
+"""
+
+
+def _hosts(**kwargs):
+    keys = (
+        ConfigValueTableKey('name', str, description=''),
+        ConfigValueTableKey('port', int, description='', default=80),
+    )
+    return ConfigValueTableArray('hosts', description='', keys=keys, **kwargs)
+
+
+def test_index():
+    Path('config.toml').write_text(_INDEXED)
+    hosts = _hosts(index_on=('name', 'port'))
+    assert {'name': 'second', 'port': 80} == hosts.by_name['second']
+    assert hosts.by_name['second'] is hosts[1]
+    assert 'first' == hosts.index('port')[1]['name']
+    assert ['first', 'second'] == list(hosts.index('name'))
+    assert hosts.by_name is hosts.by_name
+    with pytest.raises(KeyError):
+        _ = hosts.by_name['third']
+
+
+def test_index_single_table():
+    Path('config.toml').write_text('hosts = { name = "first" }')
+    hosts = _hosts(index_on=('name',))
+    assert {'name': 'first', 'port': 80} == hosts.by_name['first']
+    with pytest.raises(TypeError):
+        hosts.by_name['first']['port'] = 8080
+    with pytest.raises(TypeError):
+        hosts[0]['port'] = 8080
+    assert 80 == hosts[0]['port']
+    assert 80 == hosts.by_name['first']['port']
+    table = hosts()
+    table['port'] = 8080
+    assert 80 == hosts()['port']
+    assert 80 == hosts.port
+
+
+def test_index_refreshed_on_change():
+    Path('config.toml').write_text(_INDEXED)
+    hosts = _hosts(index_on=('name',))
+    assert 'second' in hosts.by_name
+    Path('config.toml').write_text(_INDEXED.replace('second', 'third'))
+    assert 'second' not in hosts.by_name
+    assert 'third' in hosts.by_name
+
+
+def test_index_duplicate():
+    Path('config.toml').write_text(_INDEXED.replace('second', 'first'))
+    hosts = _hosts(index_on=('name',))
+    with pytest.raises(DuplicateTableIndexError, match=r'hosts\[1\]: duplicate value for index key "name": \'first\''):
+        _ = hosts.by_name
+    assert [DuplicateTableIndexError] == [type(error) for error in collect_config_errors()]
+
+
+def test_index_wrong_key_type():
+    Path('config.toml').write_text(_INDEXED.replace('port = 1', 'port = "1"'))
+    hosts = _hosts(index_on=('port',))
+    with pytest.raises(TableKeyTypeError, match=r'hosts\[0\]: port'):
+        hosts()
+
+
+def test_index_undeclared_key():
+    with pytest.raises(ValueError, match='cannot index on an undeclared key: address'):
+        _hosts(index_on=('address',))
+
+
+def test_index_not_an_index_key():
+    Path('config.toml').write_text(_INDEXED)
+    hosts = _hosts(index_on=('name',))
+    with pytest.raises(KeyError):
+        hosts.index('port')
+    with pytest.raises(AttributeError):
+        _ = hosts.by_port
+
+
+_COLUMNS = """
+[[routes]]
+name = "first"
+weight = 10
+threshold = 0.5
+enabled = true
+
+[[routes]]
+name = "second"
+threshold = 1.5
+enabled = false
+"""
+
+
+@pytest.fixture(name='routes')
+def _routes(monkeypatch):
+    monkeypatch.setattr(_config_value_table, '_numpy', lambda: None)
+    Path('config.toml').write_text(_COLUMNS)
+    keys = (
+        ConfigValueTableKey('name', str, description=''),
+        ConfigValueTableKey('weight', int, description='', default=1),
+        ConfigValueTableKey('threshold', float, description=''),
+        ConfigValueTableKey('enabled', bool, description=''),
+    )
+    yield ConfigValueTableArray('routes', description='', keys=keys)
+
+
+def test_column(routes):
+    assert array.array('q', [10, 1]) == routes.column('weight')
+    assert array.array('d', [0.5, 1.5]) == routes.column('threshold')
+    assert array.array('b', [1, 0]) == routes.column('enabled')
+
+
+def test_column_is_cached(routes):
+    assert routes.column('weight') is routes.column('weight')
+    Path('config.toml').write_text(_COLUMNS.replace('weight = 10', 'weight = 100'))
+    assert array.array('q', [100, 1]) == routes.column('weight')
+
+
+def test_column_single_table(routes):
+    Path('config.toml').write_text('routes = { name = "first", threshold = 0.5, enabled = true }')
+    assert array.array('d', [0.5]) == routes.column('threshold')
+
+
+def test_column_wrong_type(routes):
+    Path('config.toml').write_text(_COLUMNS.replace('threshold = 1.5', 'threshold = "1.5"'))
+    with pytest.raises(TableKeyTypeError, match=r'routes\[1\]: threshold'):
+        routes.column('threshold')
+
+
+def test_column_missing_key(routes):
+    Path('config.toml').write_text(_COLUMNS.replace('enabled = false', ''))
+    with pytest.raises(MissingTableKeyError, match=r'routes\[1\]'):
+        routes.column('enabled')
+
+
+def test_column_invalid_key(routes):
+    with pytest.raises(TypeError, match='key "name" of type "string" cannot be read as a column'):
+        routes.column('name')
+    with pytest.raises(KeyError):
+        routes.column('address')
+
+
+def test_column_numpy(routes, monkeypatch):
+    numpy = pytest.importorskip('numpy')
+    monkeypatch.setattr(_config_value_table, '_numpy', lambda: numpy)
+    column = routes.column('weight')
+    assert isinstance(column, numpy.ndarray)
+    assert [10, 1] == column.tolist()
+    assert not column.flags.writeable
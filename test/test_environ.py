@@ -0,0 +1,65 @@
+# coding=utf-8
+
+import os
+
+import elib_config
+# noinspection PyProtectedMember
+from elib_config import _environ
+
+
+def test_getenv_case_insensitive():
+    os.environ['elib_config_test_var'] = 'value'
+    assert _environ.getenv('ELIB_CONFIG_TEST_VAR') == 'value'
+    assert _environ.getenv('elib_config_test_var') is None
+
+
+def test_getenv_missing():
+    assert _environ.getenv('ELIB_CONFIG_TEST_VAR') is None
+
+
+def test_getenv_added_variable():
+    assert _environ.getenv('ELIB_CONFIG_TEST_VAR') is None
+    os.environ['ELIB_CONFIG_TEST_VAR'] = 'value'
+    assert _environ.getenv('ELIB_CONFIG_TEST_VAR') == 'value'
+
+
+def test_getenv_updated_variable():
+    os.environ['ELIB_CONFIG_TEST_VAR'] = 'value'
+    assert _environ.getenv('ELIB_CONFIG_TEST_VAR') == 'value'
+    os.environ['ELIB_CONFIG_TEST_VAR'] = 'other value'
+    assert _environ.getenv('ELIB_CONFIG_TEST_VAR') == 'other value'
+
+
+def test_getenv_replaced_variable():
+    os.environ['ELIB_CONFIG_TEST_VAR'] = 'value'
+    assert _environ.getenv('ELIB_CONFIG_TEST_VAR') == 'value'
+    del os.environ['ELIB_CONFIG_TEST_VAR']
+    os.environ['ELIB_CONFIG_OTHER_TEST_VAR'] = 'value'
+    assert _environ.getenv('ELIB_CONFIG_OTHER_TEST_VAR') == 'value'
+
+
+def test_getenv_replaced_variable_other_case():
+    os.environ['ELIB_CONFIG_TEST_VAR'] = 'value'
+    assert _environ.getenv('ELIB_CONFIG_TEST_VAR') == 'value'
+    del os.environ['ELIB_CONFIG_TEST_VAR']
+    os.environ['elib_config_other_test_var'] = 'value'
+    _environ.refresh_environ()
+    assert _environ.getenv('ELIB_CONFIG_OTHER_TEST_VAR') == 'value'
+
+
+def test_getenv_removed_variable():
+    os.environ['ELIB_CONFIG_TEST_VAR'] = 'value'
+    assert _environ.getenv('ELIB_CONFIG_TEST_VAR') == 'value'
+    del os.environ['ELIB_CONFIG_TEST_VAR']
+    os.environ['ELIB_CONFIG_OTHER_TEST_VAR'] = 'value'
+    assert _environ.getenv('ELIB_CONFIG_TEST_VAR') is None
+    assert _environ.getenv('ELIB_CONFIG_OTHER_TEST_VAR') == 'value'
+
+
+def test_config_value_from_replaced_variable():
+    value = elib_config.ConfigValueString('s', description='desc', default='default')
+    os.environ['TEST__OTHER'] = 'other'
+    assert value() == 'default'
+    del os.environ['TEST__OTHER']
+    os.environ['TEST__S'] = 'from env'
+    assert value() == 'from env'
@@ -1,5 +1,6 @@
 # coding=utf-8
 
+import io
 import pathlib
 import re
 import typing
@@ -176,6 +177,18 @@ value =
 # 
 value = 
 
+"""
+    ),
+    (
+        TestCase(value_cls=elib_config.ConfigValueSet, path=('value',), list_elements_type=str),
+        """# desc
+# value type: array of strings
+# Array elements must be type: string
+# example = ["a", "b", "c", "d e"] # A list of strings
+# MANDATORY CONFIG VALUE: you *must* provide a value for this setting
+# 
+value = 
+
 """
     ),
     (
@@ -363,3 +376,119 @@ def test_config_values_to_text(test_case, expected):
     if test_case.default is not None:
         tomlkit.loads(test_file.read_text('utf8'))
     assert expected == content, content
+
+
+def test_values_before_tables():
+    elib_config.ConfigValueBool('a', 'x', description='a.x')
+    elib_config.ConfigValueBool('a', 'b', 'y', description='a.b.y')
+    elib_config.ConfigValueBool('a', 'z', description='a.z', default=True)
+    elib_config.ConfigValueBool('b', description='b')
+    _config_example.write_example_config('test')
+    content = pathlib.Path('test').read_text('utf8').split('# START OF ACTUAL CONFIG FILE')[1]
+    lines = [line for line in content.split('\n') if line and not line.startswith('# ')]
+    assert ['b = ', '[a]', 'x = ', '[a.b]', 'y = '] == lines
+    assert '# a.z\n' in content.split('[a.b]')[0]
+    document = tomlkit.loads(content.replace(' = \n', ' = true\n'))
+    assert {'b': True, 'a': {'x': True, 'b': {'y': True}}} == document
+
+
+def test_unchanged_example_is_not_rewritten():
+    elib_config.ConfigValueString('value', description='desc', default='default')
+    assert _config_example.write_example_config('test')
+    example = pathlib.Path('test')
+    example.write_text(example.read_text('utf8') + '# edited\n', 'utf8')
+    assert not _config_example.write_example_config('test')
+    assert example.read_text('utf8').endswith('# edited\n')
+
+
+@pytest.mark.parametrize(
+    'change',
+    [
+        lambda value: setattr(value, 'description', 'other desc'),
+        lambda value: setattr(value, 'default', 'other default'),
+        lambda value: elib_config.ConfigValueInteger('other', description='desc'),
+    ]
+)
+def test_changed_example_is_rewritten(change):
+    value = elib_config.ConfigValueString('value', description='desc', default='default')
+    assert _config_example.write_example_config('test')
+    change(value)
+    assert _config_example.write_example_config('test')
+    assert not _config_example.write_example_config('test')
+    assert ['test'] == [path.name for path in pathlib.Path('.').iterdir() if path.name.startswith('test')]
+
+
+def test_changed_table_keys_rewrite_example():
+    value = elib_config.ConfigValueTableArray('value', description='desc', keys=[
+        elib_config.ConfigValueTableKey('key', str, 'desc'),
+    ])
+    assert _config_example.write_example_config('test')
+    value.keys = [elib_config.ConfigValueTableKey('key', int, 'desc')]
+    assert _config_example.write_example_config('test')
+
+
+def test_stream_example_config():
+    elib_config.ConfigValueBool('a', 'x', description='a.x')
+    elib_config.ConfigValueString('b', description='b', default='text')
+    stream = io.StringIO()
+    elib_config.stream_example_config(stream)
+    _config_example.write_example_config('test')
+    assert pathlib.Path('test').read_text('utf8') == stream.getvalue()
+
+
+def test_failed_write_keeps_previous_example(monkeypatch):
+    elib_config.ConfigValueBool('a', description='a')
+    _config_example.write_example_config('test')
+    content = pathlib.Path('test').read_text('utf8')
+    elib_config.ConfigValueBool('b', description='b')
+    monkeypatch.setattr(_config_example, '_write_config_values', lambda *_: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        _config_example.write_example_config('test')
+    assert content == pathlib.Path('test').read_text('utf8')
+    assert ['test'] == [path.name for path in pathlib.Path('.').iterdir() if path.name.startswith('test')]
+
+
+def _example_of(value: ConfigValue) -> str:
+    lines: typing.List[str] = []
+    value.add_to_example(lines)
+    return '\n'.join(lines)
+
+
+def test_example_fragment_is_memoized():
+    value = elib_config.ConfigValueString('value', description='desc', default='default')
+    lines: typing.List[str] = []
+    value.add_to_example(lines)
+    value.add_to_example(lines)
+    assert lines[0] is lines[1]
+
+
+@pytest.mark.parametrize(
+    'value, change, expected',
+    [
+        (
+            lambda: elib_config.ConfigValueString('value', description='desc'),
+            lambda value: setattr(value, 'description', 'other desc'),
+            '# other desc',
+        ),
+        (
+            lambda: elib_config.ConfigValueString('value', description='desc'),
+            lambda value: setattr(value, 'default', 'other default'),
+            '# value = "other default"',
+        ),
+        (
+            lambda: elib_config.ConfigValuePath('value', description='desc'),
+            lambda value: value.must_be_dir(),
+            'must be a directory',
+        ),
+        (
+            lambda: elib_config.ConfigValueTableArray('value', description='desc'),
+            lambda value: setattr(value, 'keys', [elib_config.ConfigValueTableKey('some_key', int, 'desc')]),
+            'some_key = 1',
+        ),
+    ]
+)
+def test_example_fragment_is_invalidated(value, change, expected):
+    value = value()
+    assert expected not in _example_of(value)
+    change(value)
+    assert expected in _example_of(value)
@@ -0,0 +1,50 @@
+# coding=utf-8
+"""
+Import time regression tests
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import elib_config
+
+_PACKAGE_ROOT = str(Path(elib_config.__file__).parent.parent)
+_IMPORT_BUDGET_MS = 100
+_HEAVY_MODULES = ('tomlkit', 'tomllib', 'tomli', 'pkg_resources', 'multiprocessing')
+
+
+def _run(code: str) -> str:
+    return subprocess.check_output([sys.executable, '-c', code], cwd=_PACKAGE_ROOT, universal_newlines=True)
+
+
+@pytest.mark.parametrize(
+    'statement',
+    [
+        'import elib_config',
+        'from elib_config import ELIBConfig, ConfigValueString, ConfigValueTableArray, validate_config',
+    ]
+)
+def test_heavy_modules_not_imported(statement):
+    loaded = _run(f'import sys; {statement}; print(" ".join(sorted(sys.modules)))').split()
+    for module_name in _HEAVY_MODULES:
+        assert module_name not in loaded
+
+
+def test_import_time_budget():
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import elib_config'],
+        cwd=_PACKAGE_ROOT, stderr=subprocess.PIPE, universal_newlines=True, check=True,
+    ).stderr
+    package_line = [line for line in output.splitlines() if line.endswith('| elib_config')][-1]
+    cumulative_us = int(package_line.split('|')[1])
+    assert cumulative_us / 1000 < _IMPORT_BUDGET_MS
+
+
+def test_lazy_attributes():
+    assert 'ConfigValueBool' in dir(elib_config)
+    assert elib_config.ConfigValueBool.__name__ == 'ConfigValueBool'
+    assert isinstance(elib_config.__version__, str)
+    with pytest.raises(AttributeError):
+        getattr(elib_config, 'does_not_exist')
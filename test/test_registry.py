@@ -0,0 +1,69 @@
+# coding=utf-8
+
+import pytest
+
+from elib_config import ConfigValueBool, ConfigValueString
+# noinspection PyProtectedMember
+from elib_config._value._config_value import ConfigValue
+
+
+@pytest.fixture(name='registry')
+def _registry():
+    yield ConfigValue.config_values
+
+
+def test_register(registry):
+    value = ConfigValueBool('some', 'value', description='')
+    assert list(registry) == [value]
+    assert len(registry) == 1
+    assert registry.get('some', 'value') is value
+    assert registry.get('some') is None
+    assert registry.get('other', 'value') is None
+
+
+def test_duplicate(registry):
+    value = ConfigValueBool('some', 'value', description='')
+    duplicate = ConfigValueString('some', 'value', description='')
+    assert list(registry) == [value, duplicate]
+    assert registry.get('some', 'value') is value
+    assert not registry.is_duplicate(value)
+    assert registry.is_duplicate(duplicate)
+
+
+def test_values_under(registry):
+    value1 = ConfigValueBool('some', 'value', description='')
+    value2 = ConfigValueBool('some', 'nested', 'value', description='')
+    value3 = ConfigValueBool('other', 'value', description='')
+    assert list(registry.values_under('some')) == [value1, value2]
+    assert list(registry.values_under('some', 'nested')) == [value2]
+    assert list(registry.values_under('other')) == [value3]
+    assert list(registry.values_under()) == [value1, value2, value3]
+    assert not list(registry.values_under('missing'))
+
+
+def test_tree(registry):
+    value1 = ConfigValueBool('some', 'value', description='')
+    value2 = ConfigValueBool('a', 'value', description='')
+    tree = registry.tree()
+    assert tree == {'a': {'value': value2}, 'some': {'value': value1}}
+    assert list(tree) == ['a', 'some']
+    assert tree is registry.tree()
+    value3 = ConfigValueBool('b', description='')
+    assert registry.tree() == {'a': {'value': value2}, 'b': value3, 'some': {'value': value1}}
+
+
+def test_clear(registry):
+    ConfigValueBool('some', 'value', description='')
+    registry.clear()
+    assert not list(registry)
+    assert registry.get('some', 'value') is None
+    assert registry.tree() == {}
+
+
+def test_duplicate_resolved_path(registry):
+    value = ConfigValueBool('some', 'value', description='')
+    duplicate = ConfigValueString('some__value', description='')
+    assert registry.get('some__value') is value
+    assert registry.is_duplicate(duplicate)
+    assert list(registry.values_under('some')) == [value]
+    assert registry.tree() == {'some': {'value': value}}
@@ -0,0 +1,67 @@
+# coding=utf-8
+
+import pytest
+
+from elib_config import ConfigValueTableKey, MissingTableKeyError, TableKeyTypeError
+# noinspection PyProtectedMember
+from elib_config._value._table_schema import compile_table_validator
+
+_KEYS = (
+    ConfigValueTableKey('name', str, description=''),
+    ConfigValueTableKey('port', int, description='', default=80),
+    ConfigValueTableKey('weird "key"', float, description='', default=1.0),
+)
+
+
+def test_validator():
+    validate = compile_table_validator(_KEYS)
+    raw_table = {'name': 'some name', 'other': True}
+    assert {'name': 'some name', 'other': True, 'port': 80, 'weird "key"': 1.0} == validate(raw_table, 'value')
+    assert {'name': 'some name', 'other': True} == raw_table
+    assert {'name': 'some name', 'port': 8080, 'weird "key"': 1.0} == validate({'name': 'some name', 'port': 8080}, '')
+
+
+def test_validator_no_keys():
+    raw_table = {'name': 'some name'}
+    validated = compile_table_validator(())(raw_table, 'value')
+    assert raw_table == validated
+    assert raw_table is not validated
+
+
+def test_validator_missing_key():
+    with pytest.raises(MissingTableKeyError, match=r'value\[2\]: missing key in table'):
+        compile_table_validator(_KEYS)({'port': 80}, 'value[2]')
+
+
+@pytest.mark.parametrize(
+    'raw_table, key_name, actual_type',
+    [
+        ({'name': 1}, 'name', 'integer'),
+        ({'name': 'some name', 'port': '80'}, 'port', 'string'),
+        ({'name': 'some name', 'weird "key"': 1}, 'weird "key"', 'integer'),
+    ]
+)
+def test_validator_wrong_type(raw_table, key_name, actual_type):
+    with pytest.raises(TableKeyTypeError) as exc_info:
+        compile_table_validator(_KEYS)(raw_table, 'value')
+    assert f'{key_name}: expected a value of type' in exc_info.value.msg
+    assert f'got "{actual_type}" instead' in exc_info.value.msg
+
+
+def test_validator_wrong_default_type():
+    keys = (ConfigValueTableKey('port', int, description='', default='80'),)
+    with pytest.raises(TableKeyTypeError):
+        compile_table_validator(keys)({}, 'value')
+
+
+def test_validator_shared_between_schemas():
+    keys = (
+        ConfigValueTableKey('name', str, description='other description'),
+        ConfigValueTableKey('port', int, description='', default=8080),
+        ConfigValueTableKey('weird "key"', float, description='', default=2.0),
+    )
+    validate = compile_table_validator(keys)
+    assert validate.func is compile_table_validator(_KEYS).func
+    assert {'name': 'some name', 'port': 8080, 'weird "key"': 2.0} == validate({'name': 'some name'}, 'value')
+    with pytest.raises(MissingTableKeyError, match='other description'):
+        validate({}, 'value')
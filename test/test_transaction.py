@@ -0,0 +1,118 @@
+# coding=utf-8
+
+import pathlib
+
+import pytest
+
+import elib_config
+# noinspection PyProtectedMember
+from elib_config._file import _transaction
+
+_CONFIG = '''# user comment
+string = "value" # inline comment
+
+[table]
+# table comment
+integer = 1
+'''
+
+
+@pytest.fixture(name='config_file')
+def _config_file_fixture():
+    config_file = pathlib.Path('config.toml')
+    config_file.write_text(_CONFIG, encoding='utf8')
+    yield config_file
+
+
+def test_set(config_file):
+    value = elib_config.ConfigValueString('string', description='desc')
+    value.set('new value')
+    assert 'new value' == value()
+    assert _CONFIG.replace('"value"', '"new value"') == config_file.read_text(encoding='utf8')
+
+
+def test_set_new_table(config_file):
+    value = elib_config.ConfigValueInteger('some', 'table', 'integer', description='desc')
+    value.set(2)
+    assert 2 == value()
+    assert config_file.read_text(encoding='utf8').startswith(_CONFIG)
+
+
+def test_set_no_config_file():
+    value = elib_config.ConfigValueBool('table', 'bool', description='desc')
+    value.set(True)
+    assert value()
+
+
+def test_set_invalid_type(config_file):
+    value = elib_config.ConfigValueInteger('table', 'integer', description='desc')
+    with pytest.raises(elib_config.ConfigValueTypeError) as exc_info:
+        value.set('text')
+    assert 'got "string" instead' in str(exc_info.value)
+    assert _CONFIG == config_file.read_text(encoding='utf8')
+
+
+def test_set_refreshes_cached_value(config_file):
+    value = elib_config.ConfigValueString('string', description='desc')
+    value.set_cache_policy(elib_config.CachePolicy.forever)
+    assert 'value' == value()
+    value.set('new value')
+    assert 'new value' == value()
+
+
+def test_transaction_single_write(config_file, monkeypatch):
+    writes = []
+    monkeypatch.setattr(_transaction, '_write_file', writes.append)
+    string = elib_config.ConfigValueString('string', description='desc')
+    integer = elib_config.ConfigValueInteger('table', 'integer', description='desc')
+    with elib_config.transaction():
+        string.set('new value')
+        with elib_config.transaction():
+            integer.set(2)
+        assert not writes
+    assert 1 == len(writes)
+    assert {'string': 'new value', 'table': {'integer': 2}} == writes[0]
+
+
+def test_transaction_rollback(config_file):
+    value = elib_config.ConfigValueString('string', description='desc')
+    with pytest.raises(ZeroDivisionError):
+        with elib_config.transaction():
+            value.set('new value')
+            raise ZeroDivisionError()
+    assert _CONFIG == config_file.read_text(encoding='utf8')
+    assert 'value' == value()
+
+
+def test_transaction_rollback_table_array():
+    pathlib.Path('config.toml').write_text('[[hosts]]\nname = "first"\n\n[[hosts]]\nname = "second"\n')
+    keys = (elib_config.ConfigValueTableKey('name', str, description=''),)
+    hosts = elib_config.ConfigValueTableArray('hosts', description='', keys=keys, index_on=('name',))
+    hosts.set_cache_policy(elib_config.CachePolicy.forever)
+    assert ['first', 'second'] == list(hosts.by_name)
+    with pytest.raises(ZeroDivisionError):
+        with elib_config.transaction():
+            hosts.set([{'name': 'third'}])
+            raise ZeroDivisionError()
+    assert ['first', 'second'] == list(hosts.by_name)
+    assert 'second' == hosts[1]['name']
+
+
+def test_transaction_no_update(config_file, monkeypatch):
+    monkeypatch.setattr(_transaction, '_write_file', lambda _: pytest.fail('nothing to write'))
+    with elib_config.transaction():
+        pass
+
+
+def test_set_path():
+    value = elib_config.ConfigValuePath('path', description='desc')
+    value.set(pathlib.Path('some', 'path'))
+    assert pathlib.Path('some', 'path').absolute() == value()
+
+
+def test_set_parent_not_a_table(config_file):
+    value = elib_config.ConfigValueInteger('table', 'integer', 'value', description='desc')
+    with pytest.raises(elib_config.ConfigValueTypeError) as exc_info:
+        value.set(1)
+    assert '"table.integer" is not a table' in str(exc_info.value)
+    assert _CONFIG == config_file.read_text(encoding='utf8')
@@ -1,12 +1,16 @@
 # coding=utf-8
 
+import os
 import pathlib
+import threading
+import time
 
 import pytest
 
 from elib_config import (
-    ConfigValueBool, ConfigValueInteger, ConfigValueList, ConfigValuePath, ConfigValueString, DuplicateConfigValueError,
-    MissingValueError, validate_config,
+    ConfigValueBool, ConfigValueInteger, ConfigValueList, ConfigValuePath, ConfigValueString, ConfigValueTypeError,
+    DuplicateConfigValueError, MissingValueError, OutOfBoundError, PathMustExistError, collect_config_errors,
+    validate_config,
 )
 
 
@@ -44,6 +48,14 @@ def test_duplicate_path(val_name):
         validate_config()
 
 
+def test_duplicate_resolved_path():
+    ConfigValueString('x', 'y', description='dummy', default='string')
+    ConfigValueString('x__y', description='dummy', default='string')
+    with pytest.raises(DuplicateConfigValueError):
+        validate_config()
+    assert ({'x.y'}, set()) == validate_config(raise_=False)
+
+
 def test_missing_multiple():
     ConfigValueBool('path', 'to', 'val1', description='dummy')
     ConfigValueBool('path_to', 'val2', description='dummy')
@@ -52,3 +64,79 @@ def test_missing_multiple():
     except MissingValueError as e:
         assert 'path.to.val1' in str(e)
         assert 'path_to.val2' in str(e)
+
+
+def test_collect_all_errors():
+    pathlib.Path('config.toml').write_text('string = 1\ninteger = 20\n')
+    ConfigValueString('string', description='dummy')
+    ConfigValueInteger('integer', description='dummy').set_limits(max_=10)
+    ConfigValueBool('missing', description='dummy')
+    ConfigValueBool('bool', description='dummy', default=True)
+    ConfigValueBool('bool', description='dummy', default=True)
+    errors = collect_config_errors()
+    assert [type(error) for error in errors] == [
+        ConfigValueTypeError, OutOfBoundError, MissingValueError, DuplicateConfigValueError,
+    ]
+
+
+def test_validate_raises_other_errors():
+    pathlib.Path('config.toml').write_text('string = 1\ninteger = 20\n')
+    ConfigValueInteger('integer', description='dummy').set_limits(max_=10)
+    ConfigValueString('string', description='dummy')
+    with pytest.raises(OutOfBoundError):
+        validate_config()
+    assert (set(), set()) == validate_config(raise_=False)
+    assert [type(error) for error in collect_config_errors()] == [OutOfBoundError, ConfigValueTypeError]
+
+
+def test_validate_uses_environ():
+    ConfigValueString('string', description='dummy')
+    with pytest.raises(MissingValueError):
+        validate_config()
+    os.environ['test__string'] = 'value'
+    validate_config()
+
+
+def test_path_checks_run_concurrently(monkeypatch):
+    lock = threading.Lock()
+    running = []
+    max_running = []
+    stat = os.stat
+
+    def _slow_stat(path, *args, **kwargs):
+        if 'must_exist' not in str(path):
+            return stat(path, *args, **kwargs)
+        with lock:
+            running.append(path)
+            max_running.append(len(running))
+        time.sleep(0.02)
+        with lock:
+            running.remove(path)
+        return stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, 'stat', _slow_stat)
+    for index in range(8):
+        pathlib.Path(f'must_exist_{index}').touch()
+        ConfigValuePath(f'path_{index}', description='', default=f'must_exist_{index}').must_exist()
+    validate_config()
+    assert max(max_running) > 1
+
+
+def test_path_checks_errors_order():
+    paths = []
+    for index in range(8):
+        path = ConfigValuePath(f'path_{index}', description='', default=f'missing_{index}')
+        path.must_exist()
+        paths.append(path)
+        ConfigValueInteger(f'integer_{index}', description='', default='not an integer')
+    errors = collect_config_errors()
+    assert 16 == len(errors)
+    assert [PathMustExistError, ConfigValueTypeError] * 8 == [type(error) for error in errors]
+    assert [path.path for path in paths] == [error.value_name for error in errors[::2]]
+
+
+def test_path_checks_create_same_dir():
+    for index in range(4):
+        ConfigValuePath(f'path_{index}', description='', default='some/nested/dir').create_dir()
+    validate_config()
+    assert pathlib.Path('some/nested/dir').is_dir()